@@ -1,6 +1,11 @@
 from __future__ import annotations
 # 标准库导入
 import colorsys
+import heapq
+import itertools
+import math
+import sys
+from dataclasses import dataclass
 from typing import Any
 
 # 第三方库导入
@@ -9,6 +14,7 @@ from PySide6.QtGui import QImage
 
 # 项目模块导入
 from .color_scheme_cache import get_color_scheme_cache
+from .color_info_cache import get_color_info_cache
 
 
 # ==================== 色彩空间转换矩阵 ====================
@@ -106,6 +112,18 @@ def _srgb_to_linear(c: float) -> float:
     return ((c + 0.055) / 1.055) ** 2.4
 
 
+# sRGB 非线性值转线性值查找表（输入 0-255），模块加载时计算一次
+# _SRGB2LIN 为 Python float，供标量转换使用；_SRGB2LIN_F32 供 uint8 数组路径按索引查表，
+# 与逐像素 float32 计算结果逐位一致
+_SRGB2LIN = tuple(_srgb_to_linear(i / 255.0) for i in range(256))
+_SRGB_LEVELS_F32 = np.arange(256, dtype=np.float32) / 255.0
+_SRGB2LIN_F32 = np.where(
+    _SRGB_LEVELS_F32 <= 0.04045,
+    _SRGB_LEVELS_F32 / 12.92,
+    ((_SRGB_LEVELS_F32 + 0.055) / 1.055) ** 2.4,
+)
+
+
 def _linear_to_srgb(c: float) -> float:
     """线性值转 sRGB 非线性值"""
     if c <= 0.0031308:
@@ -152,14 +170,21 @@ def calculate_luminance_from_array(rgb_array: np.ndarray, gamma: float = 2.2) ->
     Returns:
         np.ndarray: 明度数组，形状为 (H, W)，值范围 0-255
     """
-    # 归一化到 0-1
-    rgb = rgb_array.astype(np.float32) / 255.0
-
-    if gamma == 2.2:
-        # sRGB Gamma 校正到线性空间
-        linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    if rgb_array.dtype == np.uint8:
+        # 查表转换到线性空间，避免 H×W×3 的浮点中间数组和逐像素幂运算
+        if gamma == 2.2:
+            linear = _SRGB2LIN_F32[rgb_array]
+        else:
+            linear = (_SRGB_LEVELS_F32 ** gamma)[rgb_array]
     else:
-        linear = rgb ** gamma
+        # 归一化到 0-1
+        rgb = rgb_array.astype(np.float32) / 255.0
+
+        if gamma == 2.2:
+            # sRGB Gamma 校正到线性空间
+            linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+        else:
+            linear = rgb ** gamma
 
     # Rec. 709 系数计算线性亮度
     luminance_linear = 0.2126 * linear[:, :, 0] + 0.7152 * linear[:, :, 1] + 0.0722 * linear[:, :, 2]
@@ -178,8 +203,57 @@ def calculate_luminance_from_array(rgb_array: np.ndarray, gamma: float = 2.2) ->
     return np.clip(np.round(luminance * 255), 0, 255).astype(np.uint8)
 
 
+# 可直接按字节视图读取的 32 位格式（像素按 0xAARRGGBB 存储，ARGB32 转 RGB888 时仅丢弃 alpha）
+_QIMAGE_32BIT_FORMATS = (QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32)
+
+
+class _QImageBuffer:
+    """QImage 像素内存的数组接口包装
+
+    np.asarray() 以本对象作为数组的 base，由此派生的所有视图都会持有 QImage 引用，
+    保证像素内存在数组存活期间有效（constBits() 返回的 memoryview 本身不持有 QImage）。
+    """
+
+    def __init__(self, image: QImage, channels: int):
+        """
+        Args:
+            image: QImage对象
+            channels: 每像素字节数
+        """
+        self._image = image
+        # constBits() 不会触发隐式共享的深拷贝
+        bits = np.frombuffer(image.constBits(), dtype=np.uint8)
+        self.__array_interface__ = {
+            'version': 3,
+            'shape': (image.height(), image.width(), channels),
+            'typestr': '|u1',
+            # 行间距为 bytesPerLine，自动跳过行尾对齐填充
+            'strides': (image.bytesPerLine(), channels, 1),
+            'data': (bits.__array_interface__['data'][0], True),
+        }
+
+
+def _qimage_buffer_view(image: QImage, channels: int) -> np.ndarray:
+    """将 QImage 像素内存包装为 (H, W, channels) 数组视图（零拷贝，处理行对齐）
+
+    返回的数组（及其派生视图）持有 image 引用，调用方无需另行保持 image 存活。
+
+    Args:
+        image: QImage对象
+        channels: 每像素字节数
+
+    Returns:
+        np.ndarray: 只读 uint8 数组视图
+    """
+    return np.asarray(_QImageBuffer(image, channels))
+
+
 def _qimage_to_numpy(image: QImage) -> np.ndarray:
-    """QImage转NumPy数组（使用bits()直接内存访问）
+    """QImage转NumPy数组（使用constBits()直接内存访问）
+
+    RGB888、RGB32、ARGB32 格式直接返回图像内存上的只读视图，不做格式转换和复制，
+    视图持有 QImage 引用，临时图像（如 pixmap.toImage()）也可安全传入。
+    其他格式先转换为 RGB888，返回转换后图像上的视图。
 
     Args:
         image: QImage对象
@@ -189,28 +263,22 @@ def _qimage_to_numpy(image: QImage) -> np.ndarray:
     """
     width = image.width()
     height = image.height()
+    if width == 0 or height == 0:
+        return np.zeros((height, width, 3), dtype=np.uint8)
 
-    # 确保格式为RGB888
-    if image.format() != QImage.Format.Format_RGB888:
-        image = image.convertToFormat(QImage.Format.Format_RGB888)
+    image_format = image.format()
 
-    # 直接访问内存
-    ptr = image.bits()
-    bytes_per_line = image.bytesPerLine()
+    if image_format in _QIMAGE_32BIT_FORMATS:
+        view = _qimage_buffer_view(image, 4)
+        # 小端序内存为 B, G, R, A；大端序为 A, R, G, B
+        return view[..., 2::-1] if sys.byteorder == 'little' else view[..., 1:4]
 
-    # 创建NumPy数组（考虑行对齐）
-    if bytes_per_line == width * 3:
-        # 无行对齐，直接转换
-        arr = np.array(ptr, dtype=np.uint8).reshape((height, width, 3))
-    else:
-        # 有行对齐，需要逐行复制
-        arr = np.zeros((height, width, 3), dtype=np.uint8)
-        for y in range(height):
-            offset = y * bytes_per_line
-            row = np.array(ptr[offset:offset + width * 3], dtype=np.uint8)
-            arr[y] = row.reshape((width, 3))
+    if image_format == QImage.Format.Format_RGB888:
+        return _qimage_buffer_view(image, 3)
 
-    return arr
+    # 其他格式：视图持有转换后的图像，无需复制
+    converted = image.convertToFormat(QImage.Format.Format_RGB888)
+    return _qimage_buffer_view(converted, 3)
 
 
 # ==================== 配色常量定义 ====================
@@ -221,9 +289,32 @@ DEFAULT_BRIGHTNESS_STEPS = [100, 90, 80, 70]
 DEFAULT_ANALOGOUS_ANGLE = 30
 DEFAULT_SPLIT_ANGLE = 30
 
+# 配色方案颜色数量达到该值时改用 NumPy 向量化构建（小数量时循环开销更低）
+_VECTORIZE_MIN_COUNT = 16
+
+# 预览颜色数量达到该值时，HSB 转 RGB 改用批量向量化计算
+_HSB_BATCH_MIN_COUNT = 8
+
+# 主色调提取的采样像素上限：大图自动增大采样步长，限制内存与耗时
+_DOMINANT_SAMPLE_BUDGET = 200_000
+
 # Zone分区宽度常量 (255/9 = 28.333...)
 ZONE_WIDTH = 255 / 9
 
+# hex_to_rgb SWAR 常量：8 个字节通道同时做范围比较
+# 对 ASCII 字节 x，(x + 0x80 - lo) 的最高位表示 x >= lo，(x + 0x7F - hi) 的最高位表示 x > hi
+_SWAR_ONES = 0x0101010101010101
+_SWAR_HIGH = 0x80 * _SWAR_ONES
+_SWAR_CASE = 0x20 * _SWAR_ONES
+_SWAR_LOW_NIBBLE = 0x0F * _SWAR_ONES
+_SWAR_DIGIT_GE = (0x80 - ord('0')) * _SWAR_ONES
+_SWAR_DIGIT_GT = (0x7F - ord('9')) * _SWAR_ONES
+_SWAR_ALPHA_GE = (0x80 - ord('a')) * _SWAR_ONES
+_SWAR_ALPHA_GT = (0x7F - ord('f')) * _SWAR_ONES
+
+# rgb_to_hex 查找表：0-255 对应的两位大写十六进制字符串
+_HEX_BYTES = tuple(f"{i:02X}" for i in range(256))
+
 
 def _generate_saturation_steps(base_saturation: float, count: int) -> list[float]:
     """生成饱和度递减序列
@@ -246,6 +337,20 @@ def _generate_saturation_steps(base_saturation: float, count: int) -> list[float
     return [max(MIN_SATURATION, base_saturation - i * step) for i in range(count)]
 
 
+def _saturation_steps_array(base_saturation: float, count: int) -> np.ndarray:
+    """生成饱和度递减序列（向量化版本，对应 count != 4 的分支）
+
+    Args:
+        base_saturation: 基准饱和度 (0-100)
+        count: 生成数量
+
+    Returns:
+        np.ndarray: 饱和度数组，所有值不低于 MIN_SATURATION
+    """
+    step = (base_saturation - MIN_SATURATION) / max(count - 1, 1)
+    return np.maximum(MIN_SATURATION, base_saturation - np.arange(count) * step)
+
+
 def _generate_brightness_steps(count: int) -> list[float]:
     """生成明度递减序列
 
@@ -294,16 +399,12 @@ def rgb_to_lab(r: int, g: int, b: int, colorspace_name: str = 'sRGB') -> tuple[f
     gamma = cs['gamma']
     use_srgb_curve = cs.get('use_srgb_curve', False)
 
-    r_norm, g_norm, b_norm = r / 255.0, g / 255.0, b / 255.0
-
     if use_srgb_curve:
-        r_norm = ((r_norm + 0.055) / 1.055) ** 2.4 if r_norm > 0.04045 else r_norm / 12.92
-        g_norm = ((g_norm + 0.055) / 1.055) ** 2.4 if g_norm > 0.04045 else g_norm / 12.92
-        b_norm = ((b_norm + 0.055) / 1.055) ** 2.4 if b_norm > 0.04045 else b_norm / 12.92
+        r_norm, g_norm, b_norm = _SRGB2LIN[r], _SRGB2LIN[g], _SRGB2LIN[b]
     else:
-        r_norm = r_norm ** gamma
-        g_norm = g_norm ** gamma
-        b_norm = b_norm ** gamma
+        r_norm = (r / 255.0) ** gamma
+        g_norm = (g / 255.0) ** gamma
+        b_norm = (b / 255.0) ** gamma
 
     x = r_norm * m[0][0] + g_norm * m[0][1] + b_norm * m[0][2]
     y = r_norm * m[1][0] + g_norm * m[1][1] + b_norm * m[1][2]
@@ -328,13 +429,22 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
 
     Returns:
         str: 16进制颜色值，如 "#FF0000"
+
+    Raises:
+        ValueError: 通道值超出 0-255 范围
     """
-    return f"#{r:02X}{g:02X}{b:02X}"
+    # 先校验范围：负数下标会从查找表末尾取值，不能直接索引
+    if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+        raise ValueError(f"RGB通道值超出范围 0-255: ({r}, {g}, {b})")
+    return "#" + _HEX_BYTES[r] + _HEX_BYTES[g] + _HEX_BYTES[b]
 
 
 def hex_to_rgb(hex_value: str) -> tuple[int, int, int]:
     """将16进制颜色值转换为RGB
 
+    使用 SWAR（单寄存器多字节并行）方式一次性完成字符校验与解析，
+    避免逐字符迭代和多次 int(..., 16) 调用
+
     Args:
         hex_value: 16进制颜色值，如 "#FF0000" 或 "FF0000"
 
@@ -345,20 +455,33 @@ def hex_to_rgb(hex_value: str) -> tuple[int, int, int]:
         ValueError: 当输入格式无效时
     """
     # 移除 # 前缀和空白字符
-    hex_value = hex_value.lstrip('#').strip().upper()
+    hex_value = hex_value.lstrip('#').strip()
 
     # 验证长度
     if len(hex_value) != 6:
         raise ValueError("无效的16进制颜色值，必须是6位十六进制数")
 
+    # 非 ASCII 字符必然非法，补齐两个 '0' 凑成 8 字节（小端序，补位在高字节）
+    try:
+        v = int.from_bytes(hex_value.encode('ascii') + b'00', 'little')
+    except UnicodeEncodeError:
+        raise ValueError("无效的16进制颜色值，包含非法字符") from None
+
+    # 按字节并行判断是否为 '0'-'9' 或 'a'-'f'（大写经 | 0x20 折叠为小写）
+    digit = (v + _SWAR_DIGIT_GE) & ~(v + _SWAR_DIGIT_GT) & _SWAR_HIGH
+    lower = v | _SWAR_CASE
+    letter = (lower + _SWAR_ALPHA_GE) & ~(lower + _SWAR_ALPHA_GT) & _SWAR_HIGH
+
     # 验证字符有效性
-    if not all(c in '0123456789ABCDEF' for c in hex_value):
+    if digit | letter != _SWAR_HIGH:
         raise ValueError("无效的16进制颜色值，包含非法字符")
 
-    # 转换为RGB
-    r = int(hex_value[0:2], 16)
-    g = int(hex_value[2:4], 16)
-    b = int(hex_value[4:6], 16)
+    # 每字节取低4位，字母额外加 9（'A' & 0x0F == 1）
+    nibbles = (v & _SWAR_LOW_NIBBLE) + (letter >> 7) * 9
+
+    r = (nibbles & 0x0F) << 4 | (nibbles >> 8) & 0x0F
+    g = ((nibbles >> 16) & 0x0F) << 4 | (nibbles >> 24) & 0x0F
+    b = ((nibbles >> 32) & 0x0F) << 4 | (nibbles >> 40) & 0x0F
 
     return r, g, b
 
@@ -420,52 +543,6 @@ def _rgb_to_hsb_normalized(r_norm: float, g_norm: float, b_norm: float) -> tuple
     return h * 360, s * 100, v * 100
 
 
-def _rgb_to_lab_normalized(
-    r_norm: float, g_norm: float, b_norm: float,
-    colorspace_name: str = 'sRGB'
-) -> tuple[float, float, float]:
-    """将归一化的RGB转换为LAB (内部函数)
-
-    Args:
-        r_norm: 红色通道归一化值 (0.0-1.0)
-        g_norm: 绿色通道归一化值 (0.0-1.0)
-        b_norm: 蓝色通道归一化值 (0.0-1.0)
-        colorspace_name: 色彩空间名称,默认 sRGB
-
-    Returns:
-        tuple: (L 0-100, A -128-127, B -128-127)
-    """
-    cs = _get_colorspace_matrices(colorspace_name)
-    m = cs['rgb_to_xyz']
-    wp = cs['white_point']
-    gamma = cs['gamma']
-    use_srgb_curve = cs.get('use_srgb_curve', False)
-
-    # Gamma 校正
-    if use_srgb_curve:
-        r_norm = ((r_norm + 0.055) / 1.055) ** 2.4 if r_norm > 0.04045 else r_norm / 12.92
-        g_norm = ((g_norm + 0.055) / 1.055) ** 2.4 if g_norm > 0.04045 else g_norm / 12.92
-        b_norm = ((b_norm + 0.055) / 1.055) ** 2.4 if b_norm > 0.04045 else b_norm / 12.92
-    else:
-        r_norm = r_norm ** gamma
-        g_norm = g_norm ** gamma
-        b_norm = b_norm ** gamma
-
-    # 转换到XYZ
-    x = r_norm * m[0][0] + g_norm * m[0][1] + b_norm * m[0][2]
-    y = r_norm * m[1][0] + g_norm * m[1][1] + b_norm * m[1][2]
-    z = r_norm * m[2][0] + g_norm * m[2][1] + b_norm * m[2][2]
-
-    x, y, z = x / wp[0], y / wp[1], z / wp[2]
-
-    # 转换到LAB
-    L = 116 * _lab_f(y) - 16
-    A = 500 * (_lab_f(x) - _lab_f(y))
-    B = 200 * (_lab_f(y) - _lab_f(z))
-
-    return L, A, B
-
-
 def _rgb_to_hsl_normalized(r_norm: float, g_norm: float, b_norm: float) -> tuple[float, float, float]:
     """将归一化的RGB转换为HSL (内部函数)
 
@@ -532,9 +609,51 @@ def convert_rgb_colorspace(
         return r, g, b
 
 
+@dataclass(frozen=True, slots=True)
+class ColorInfo:
+    """颜色完整信息（不可变，可在缓存中安全共享）"""
+    rgb: tuple[int, int, int]
+    hsb: tuple[int, int, int]
+    lab: tuple[int, int, int]
+    hsl: tuple[int, int, int]
+    cmyk: tuple[int, int, int, int]
+    hex: str
+
+    def as_dict(self) -> dict[str, Any]:
+        """转换为 get_color_info 使用的字典格式（每次返回新字典，调用方可自由修改）"""
+        return {
+            'rgb': self.rgb,
+            'hsb': self.hsb,
+            'lab': self.lab,
+            'hsl': self.hsl,
+            'cmyk': self.cmyk,
+            'rgb_display': self.rgb,
+            'hex': self.hex
+        }
+
+
+def _compute_color_info(r: int, g: int, b: int, colorspace_name: str) -> ColorInfo:
+    """计算颜色的完整信息（不使用缓存）"""
+    H, S, B = rgb_to_hsb(r, g, b)
+    L, A, B_lab = rgb_to_lab(r, g, b, colorspace_name)
+    H2, S2, L2 = rgb_to_hsl(r, g, b)
+    C, M, Y, K = rgb_to_cmyk(r, g, b)
+
+    return ColorInfo(
+        rgb=(r, g, b),
+        hsb=(round(H), round(S), round(B)),
+        lab=(round(L), round(A), round(B_lab)),
+        hsl=(round(H2), round(S2), round(L2)),
+        cmyk=(round(C), round(M), round(Y), round(K)),
+        hex=rgb_to_hex(r, g, b)
+    )
+
+
 def get_color_info(r: int, g: int, b: int, colorspace_name: str = 'sRGB') -> dict[str, Any]:
     """获取颜色的完整信息
 
+    转换结果以不可变的 ColorInfo 缓存，命中时只需构建一个新字典
+
     Args:
         r: 红色通道值 (0-255)
         g: 绿色通道值 (0-255)
@@ -544,20 +663,12 @@ def get_color_info(r: int, g: int, b: int, colorspace_name: str = 'sRGB') -> dic
     Returns:
         dict: 包含RGB、HSB、LAB、HEX、HSL、CMYK颜色信息的字典
     """
-    H, S, B = rgb_to_hsb(r, g, b)
-    L, A, B_lab = rgb_to_lab(r, g, b, colorspace_name)
-    H2, S2, L2 = rgb_to_hsl(r, g, b)
-    C, M, Y, K = rgb_to_cmyk(r, g, b)
-
-    return {
-        'rgb': (r, g, b),
-        'hsb': (round(H), round(S), round(B)),
-        'lab': (round(L), round(A), round(B_lab)),
-        'hsl': (round(H2), round(S2), round(L2)),
-        'cmyk': (round(C), round(M), round(Y), round(K)),
-        'rgb_display': (r, g, b),
-        'hex': rgb_to_hex(r, g, b)
-    }
+    cache = get_color_info_cache()
+    info = cache.get(r, g, b, colorspace_name)
+    if info is None:
+        info = _compute_color_info(r, g, b, colorspace_name)
+        cache.set(r, g, b, colorspace_name, info)
+    return info.as_dict()
 
 
 def get_color_info_batch(rgb_list: list[tuple[int, int, int]], colorspace_name: str = 'sRGB') -> list[dict[str, Any]]:
@@ -579,7 +690,8 @@ def get_color_info_batch(rgb_list: list[tuple[int, int, int]], colorspace_name:
 
         # 使用内部函数处理
         H, S, B = _rgb_to_hsb_normalized(r_norm, g_norm, b_norm)
-        L, A, B_lab = _rgb_to_lab_normalized(r_norm, g_norm, b_norm, colorspace_name)
+        # LAB 直接使用整数通道，经 _SRGB2LIN 查表完成 Gamma 解码
+        L, A, B_lab = rgb_to_lab(r, g, b, colorspace_name)
         H2, S2, L2 = _rgb_to_hsl_normalized(r_norm, g_norm, b_norm)
         C, M, Y, K = _rgb_to_cmyk_normalized(r_norm, g_norm, b_norm)
 
@@ -611,18 +723,14 @@ def get_luminance(r: int, g: int, b: int, gamma: float = 2.2) -> int:
     Returns:
         int: 明度值 (0-255)
     """
-    r_norm = r / 255.0
-    g_norm = g / 255.0
-    b_norm = b / 255.0
-
     if gamma == 2.2:
-        r_linear = _srgb_to_linear(r_norm)
-        g_linear = _srgb_to_linear(g_norm)
-        b_linear = _srgb_to_linear(b_norm)
+        r_linear = _SRGB2LIN[r]
+        g_linear = _SRGB2LIN[g]
+        b_linear = _SRGB2LIN[b]
     else:
-        r_linear = r_norm ** gamma
-        g_linear = g_norm ** gamma
-        b_linear = b_norm ** gamma
+        r_linear = (r / 255.0) ** gamma
+        g_linear = (g / 255.0) ** gamma
+        b_linear = (b / 255.0) ** gamma
 
     luminance_linear = 0.2126 * r_linear + 0.7152 * g_linear + 0.0722 * b_linear
 
@@ -808,6 +916,60 @@ def hsb_to_rgb(h: float, s: float, b: float) -> tuple[int, int, int]:
     return round(r * 255), round(g * 255), round(b_out * 255)
 
 
+def _hsb_to_rgb_batch(h: np.ndarray, s: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """向量化HSB转RGB
+
+    与 colorsys.hsv_to_rgb 使用相同的分段公式，结果与逐个调用 hsb_to_rgb 完全一致
+
+    Args:
+        h: 色相数组 (0-360)
+        s: 饱和度数组 (0-100)
+        b: 亮度数组 (0-100)
+
+    Returns:
+        np.ndarray: RGB数组 (N×3)，dtype=np.int64
+    """
+    h_norm = np.asarray(h, dtype=np.float64) / 360.0
+    s_norm = np.asarray(s, dtype=np.float64) / 100.0
+    v = np.asarray(b, dtype=np.float64) / 100.0
+
+    sector = np.trunc(h_norm * 6.0)
+    f = h_norm * 6.0 - sector
+    p = v * (1.0 - s_norm)
+    q = v * (1.0 - s_norm * f)
+    t = v * (1.0 - s_norm * (1.0 - f))
+    sector = sector.astype(np.int64) % 6
+
+    conditions = [sector == i for i in range(6)]
+    r_out = np.select(conditions, [v, q, p, p, t, v])
+    g_out = np.select(conditions, [t, v, v, q, p, p])
+    b_out = np.select(conditions, [p, p, t, v, v, q])
+
+    # 饱和度为 0 时为灰色
+    gray = s_norm == 0.0
+    r_out = np.where(gray, v, r_out)
+    g_out = np.where(gray, v, g_out)
+    b_out = np.where(gray, v, b_out)
+
+    return np.round(np.stack([r_out, g_out, b_out], axis=-1) * 255).astype(np.int64)
+
+
+def _hsb_colors_to_rgb(hsb_colors: list[tuple[float, float, float]]) -> list[tuple[int, int, int]]:
+    """将HSB颜色列表转换为RGB颜色列表，数量较多时使用向量化计算
+
+    Args:
+        hsb_colors: HSB颜色列表 [(h, s, b), ...]
+
+    Returns:
+        list: RGB颜色列表 [(r, g, b), ...]
+    """
+    if len(hsb_colors) < _HSB_BATCH_MIN_COUNT:
+        return [hsb_to_rgb(h, s, b) for h, s, b in hsb_colors]
+
+    h, s, b = np.asarray(hsb_colors, dtype=np.float64).T
+    return [tuple(rgb) for rgb in _hsb_to_rgb_batch(h, s, b).tolist()]
+
+
 def lab_to_rgb(L: float, A: float, B: float, colorspace_name: str = 'sRGB') -> tuple[int, int, int]:
     """将LAB转换为RGB
 
@@ -914,6 +1076,11 @@ def _build_monochromatic_colors(rgb_hue: float, count: int, base_saturation: flo
     Returns:
         list: HSB颜色列表 [(h, s, b), ...]
     """
+    if count >= _VECTORIZE_MIN_COUNT:
+        saturations = np.clip(_saturation_steps_array(base_saturation, count), MIN_SATURATION, 100)
+        brightnesses = np.clip(100 - np.arange(count) * (30 / max(count - 1, 1)), 40, 100)
+        return list(zip([rgb_hue % 360] * count, saturations.tolist(), brightnesses.tolist()))
+
     colors = []
     saturations = _generate_saturation_steps(base_saturation, count)
     brightnesses = _generate_brightness_steps(count)
@@ -946,6 +1113,8 @@ def _calculate_analogous_hues(base_hue: float, angle: float, count: int) -> list
         ]
     else:
         step = (2 * angle) / max(count - 1, 1)
+        if count >= _VECTORIZE_MIN_COUNT:
+            return ((base_hue - angle + np.arange(count) * step) % 360).tolist()
         return [(base_hue - angle + i * step) % 360 for i in range(count)]
 
 
@@ -962,6 +1131,13 @@ def _build_analogous_colors(
     Returns:
         list: HSB颜色列表 [(h, s, b), ...]
     """
+    count = len(rgb_hues)
+    if count >= _VECTORIZE_MIN_COUNT:
+        hues = np.asarray(rgb_hues, dtype=np.float64) % 360
+        distance_from_center = np.abs(np.arange(count) - count / 2) / (count / 2)
+        saturations = np.clip(base_saturation * (1 - distance_from_center * 0.3), 60, 100)
+        return list(zip(hues.tolist(), saturations.tolist(), [90] * count))
+
     colors = []
     for i, h in enumerate(rgb_hues):
         distance_from_center = abs(i - len(rgb_hues) / 2) / (len(rgb_hues) / 2)
@@ -1000,6 +1176,14 @@ def _build_complementary_colors(
             (comp_hue, comp_saturations[0], 100),
             (comp_hue, max(30, comp_saturations[1]), 90),
         ]
+    elif count >= _VECTORIZE_MIN_COUNT:
+        base_count = (count + 1) // 2
+        comp_count = count - base_count
+
+        for hue, hue_count in ((base_hue, base_count), (comp_hue, comp_count)):
+            saturations = np.maximum(30, _saturation_steps_array(base_saturation, hue_count))
+            brightnesses = np.maximum(80, 100 - np.arange(hue_count) * (20 / max(hue_count, 1)))
+            colors.extend(zip([hue] * hue_count, saturations.tolist(), brightnesses.tolist()))
     else:
         base_count = (count + 1) // 2
         comp_count = count - base_count
@@ -1054,6 +1238,12 @@ def _build_split_complementary_colors(
             (right_hue, max(50, base_saturation * 0.9), 100)
         ])
         remaining = count - 3
+        if count >= _VECTORIZE_MIN_COUNT:
+            steps = np.arange(remaining)
+            blend_hues = (base_hue + (steps + 1) * 60) % 360
+            saturations = np.maximum(50, base_saturation * (0.7 - steps * 0.1))
+            colors.extend(zip(blend_hues.tolist(), saturations.tolist(), [85] * remaining))
+            return colors
         for i in range(remaining):
             blend_hue = (base_hue + (i + 1) * 60) % 360
             s = max(50, base_saturation * (0.7 - i * 0.1))
@@ -1089,6 +1279,12 @@ def _build_double_complementary_colors(
     else:
         for i in range(min(count, 4)):
             colors.append((hues[i], saturations[i], 95))
+        if count >= _VECTORIZE_MIN_COUNT:
+            steps = np.arange(4, count)
+            blend_hues = (hues[0] + steps * 45) % 360
+            blend_saturations = np.maximum(50, saturations[0] * (0.7 - (steps - 4) * 0.1))
+            colors.extend(zip(blend_hues.tolist(), blend_saturations.tolist(), [85] * (count - 4)))
+            return colors
         for i in range(4, count):
             blend_hue = (hues[0] + i * 45) % 360
             s = max(50, saturations[0] * (0.7 - (i - 4) * 0.1))
@@ -1239,9 +1435,9 @@ def get_scheme_preview_colors(
     # 尝试从缓存获取
     if use_cache:
         cache = get_color_scheme_cache()
-        cached_hsb = cache.get(scheme_type, base_hue, count, base_saturation)
-        if cached_hsb is not None:
-            return [hsb_to_rgb(h, s, b) for h, s, b in cached_hsb]
+        cached_rgb = cache.get(scheme_type, base_hue, count, base_saturation)
+        if cached_rgb is not None:
+            return list(cached_rgb)
 
     # 根据方案类型调用对应的生成器，传递 base_saturation 参数
     if scheme_type == 'monochromatic':
@@ -1257,80 +1453,73 @@ def get_scheme_preview_colors(
     else:
         hsb_colors = generate_monochromatic(base_hue, count, base_saturation)
 
-    # 存入缓存
+    rgb_colors = _hsb_colors_to_rgb(hsb_colors)
+
+    # 存入缓存（缓存转换后的RGB结果，命中时无需再做HSB转RGB）
     if use_cache:
-        cache.set(scheme_type, base_hue, count, base_saturation, hsb_colors)
+        cache.set(scheme_type, base_hue, count, base_saturation, tuple(rgb_colors))
 
-    return [hsb_to_rgb(h, s, b) for h, s, b in hsb_colors]
+    return rgb_colors
 
 
 # ==================== MMCQ 主色调提取算法 ====================
 
 class _ColorCube:
-    """MMCQ 颜色立方体，用于表示颜色空间中的一个区域"""
+    """MMCQ 颜色立方体，用于表示颜色空间中的一个区域
+
+    像素按通道存储为 (3×N) 数组：按轴归约时每个通道都是连续内存，
+    比 (N×3) 布局的 axis=0 归约快一个数量级
+    """
 
-    def __init__(self, pixels: np.ndarray):
+    def __init__(self, channels: np.ndarray):
         """
         Args:
-            pixels: RGB 像素数组 (N×3)，dtype=np.int32
+            channels: 按通道存储的像素数组 (3×N)，通常为 dtype=np.uint8
         """
-        self._np_pixels = pixels
-        self._cache_volume = None
+        self._np_pixels = channels
         self._cache_avg_color = None
-        self._cache_ranges = None
 
-    def _get_ranges(self) -> tuple[int, int, int, int, int, int]:
-        """获取各颜色通道的范围（使用缓存）"""
-        if self._cache_ranges is not None:
-            return self._cache_ranges
-
-        if len(self._np_pixels) == 0:
-            self._cache_ranges = (0, 0, 0, 0, 0, 0)
-            return self._cache_ranges
-
-        # 使用 numpy 快速计算
-        r_min, r_max = int(self._np_pixels[:, 0].min()), int(self._np_pixels[:, 0].max())
-        g_min, g_max = int(self._np_pixels[:, 1].min()), int(self._np_pixels[:, 1].max())
-        b_min, b_max = int(self._np_pixels[:, 2].min()), int(self._np_pixels[:, 2].max())
+        # 构造时一次性求出各通道最小/最大值：每个立方体都要以体积参与堆排序，
+        # 平均色只有最终保留的立方体才需要，仍按需计算
+        if channels.shape[1] == 0:
+            self._ranges = (0, 0, 0, 0, 0, 0)
+            self._volume = 0
+        else:
+            r_min, g_min, b_min = channels.min(axis=1).tolist()
+            r_max, g_max, b_max = channels.max(axis=1).tolist()
+            self._ranges = (r_min, r_max, g_min, g_max, b_min, b_max)
+            self._volume = (r_max - r_min) * (g_max - g_min) * (b_max - b_min)
 
-        self._cache_ranges = (r_min, r_max, g_min, g_max, b_min, b_max)
-        return self._cache_ranges
+    def _get_ranges(self) -> tuple[int, int, int, int, int, int]:
+        """获取各颜色通道的范围"""
+        return self._ranges
 
     def get_volume(self) -> int:
-        """计算立方体体积（各颜色通道的范围乘积）"""
-        if self._cache_volume is not None:
-            return self._cache_volume
-
-        if len(self._np_pixels) == 0:
-            self._cache_volume = 0
-            return 0
-
-        r_min, r_max, g_min, g_max, b_min, b_max = self._get_ranges()
-        self._cache_volume = (r_max - r_min) * (g_max - g_min) * (b_max - b_min)
-        return self._cache_volume
+        """获取立方体体积（各颜色通道的范围乘积）"""
+        return self._volume
 
     def get_count(self) -> int:
         """获取像素数量"""
-        return len(self._np_pixels)
+        return self._np_pixels.shape[1]
 
     def get_average_color(self) -> tuple[int, int, int]:
         """计算立方体内像素的平均颜色"""
         if self._cache_avg_color is not None:
             return self._cache_avg_color
 
-        if len(self._np_pixels) == 0:
+        if self.get_count() == 0:
             self._cache_avg_color = (0, 0, 0)
             return self._cache_avg_color
 
         # 使用 numpy 快速计算
-        avg = self._np_pixels.mean(axis=0)
+        avg = self._np_pixels.mean(axis=1)
         self._cache_avg_color = (int(round(avg[0])), int(round(avg[1])), int(round(avg[2])))
 
         return self._cache_avg_color
 
     def get_longest_axis(self) -> str:
         """获取最长的颜色轴 ('r', 'g', 或 'b')"""
-        if len(self._np_pixels) == 0:
+        if self.get_count() == 0:
             return 'r'
 
         r_min, r_max, g_min, g_max, b_min, b_max = self._get_ranges()
@@ -1349,118 +1538,154 @@ class _ColorCube:
 
     def split(self) -> tuple['_ColorCube', '_ColorCube']:
         """沿最长轴的中位数切分立方体"""
-        if len(self._np_pixels) == 0:
-            empty = np.array([], dtype=np.int32).reshape(0, 3)
+        if self.get_count() == 0:
+            empty = self._np_pixels[:, :0]
             return _ColorCube(empty), _ColorCube(empty)
 
         axis = self.get_longest_axis()
         axis_index = {'r': 0, 'g': 1, 'b': 2}[axis]
 
-        # 使用 numpy 排序和切片
-        sorted_indices = np.argsort(self._np_pixels[:, axis_index])
-        mid = len(sorted_indices) // 2
-
-        # 直接使用 numpy 数组切片
-        pixels1 = self._np_pixels[sorted_indices[:mid]]
-        pixels2 = self._np_pixels[sorted_indices[mid:]]
+        # 中位数切分只需分区而无需完整排序（O(N) 而非 O(N log N)）
+        mid = self.get_count() // 2
+        order = np.argpartition(self._np_pixels[axis_index], mid)
+        partitioned = np.take(self._np_pixels, order, axis=1)
 
-        return _ColorCube(pixels1), _ColorCube(pixels2)
+        # 子立方体共享同一块重排后的内存，仅持有切片视图
+        return _ColorCube(partitioned[:, :mid]), _ColorCube(partitioned[:, mid:])
 
 
 def _mmcq_quantize(pixels: np.ndarray, count: int) -> list[_ColorCube]:
     """MMCQ 算法核心实现
 
+    使用按体积排序的最大堆选择待切分立方体，避免每轮线性扫描全部立方体
+
     Args:
-        pixels: RGB 像素数组 (N×3)
+        pixels: RGB 像素数组 (N×3)，直接使用提取得到的 uint8 数组，无需转换为 int32
         count: 目标颜色数量
 
     Returns:
-        list: 颜色立方体列表
+        list: 颜色立方体列表（按生成顺序）
     """
     if len(pixels) == 0 or count <= 0:
         return []
 
-    # 初始立方体包含所有像素
-    cubes = [_ColorCube(pixels)]
-
-    # 递归切分直到达到目标数量
-    while len(cubes) < count:
-        # 找到体积最大的立方体进行切分
-        max_volume = -1
-        cube_to_split = None
-        cube_index = -1
-
-        for i, cube in enumerate(cubes):
-            # 优先切分像素数量多且体积大的立方体
-            volume = cube.get_volume()
-            pixel_count = cube.get_count()
-            if pixel_count > 1 and volume > max_volume:
-                max_volume = volume
-                cube_to_split = cube
-                cube_index = i
-
-        if cube_to_split is None or cube_to_split.get_count() <= 1:
-            break
+    # 堆元素: (-体积, 生成序号, 立方体)；体积相同时优先切分较早生成的立方体
+    heap: list[tuple[int, int, _ColorCube]] = []
+    # 像素数量不足以再切分的立方体: (生成序号, 立方体)
+    leaves: list[tuple[int, _ColorCube]] = []
+    order = itertools.count()
+
+    def push(cube: _ColorCube) -> None:
+        if cube.get_count() > 1:
+            heapq.heappush(heap, (-cube.get_volume(), next(order), cube))
+        else:
+            leaves.append((next(order), cube))
+
+    # 初始立方体包含所有像素（转为按通道存储）
+    push(_ColorCube(np.ascontiguousarray(pixels.T)))
 
-        # 移除原立方体，添加切分后的两个立方体
-        cubes.pop(cube_index)
+    # 切分体积最大的立方体直到达到目标数量
+    while heap and len(heap) + len(leaves) < count:
+        _, _, cube_to_split = heapq.heappop(heap)
         cube1, cube2 = cube_to_split.split()
-        cubes.append(cube1)
-        cubes.append(cube2)
+        push(cube1)
+        push(cube2)
 
-    return cubes
+    cubes = [(index, cube) for _, index, cube in heap] + leaves
+    cubes.sort(key=lambda item: item[0])
+    return [cube for _, cube in cubes]
 
 
-def _extract_pixels_fast(image, sample_step: int = 4) -> np.ndarray:
-    """快速提取图片像素数据
+def _budget_sample_step(height: int, width: int, sample_step: int) -> int:
+    """按采样像素上限计算实际采样步长
 
     Args:
-        image: QImage 或 PIL Image 对象
-        sample_step: 采样步长
+        height: 图片高度
+        width: 图片宽度
+        sample_step: 调用方指定的采样步长，作为下限
 
     Returns:
-        np.ndarray: RGB 像素数组 (N×3)，dtype=np.uint8
+        int: 使采样像素数不超过 _DOMINANT_SAMPLE_BUDGET 的最小步长（不小于 sample_step）
     """
-    # 处理 QImage
-    if hasattr(image, 'width') and hasattr(image, 'height'):
-        width = image.width()
-        height = image.height()
+    area = height * width
+    if area <= _DOMINANT_SAMPLE_BUDGET * sample_step * sample_step:
+        return sample_step
+    return max(sample_step, math.ceil(math.sqrt(area / _DOMINANT_SAMPLE_BUDGET)))
 
-        if hasattr(image, 'bits'):
-            arr = _qimage_to_numpy(image)
 
-            # 采样像素
-            sampled = arr[::sample_step, ::sample_step].reshape(-1, 3)
+def _sample_pixels_with_edges(arr: np.ndarray, sample_step: int) -> np.ndarray:
+    """按步长采样像素并合并右边缘、下边缘像素
 
-            # 合并边缘像素
-            if width > 0 and height > 0:
-                right_edge = arr[::sample_step, -1]
-                bottom_edge = arr[-1, ::sample_step]
-                edges = np.vstack([right_edge, bottom_edge])
-                return np.vstack([sampled, edges])
+    采样网格与两条边缘直接写入同一个预分配数组，不产生中间数组
 
-            return sampled
+    Args:
+        arr: RGB 像素数组 (H×W×3)
+        sample_step: 采样步长（下限，大图按 _DOMINANT_SAMPLE_BUDGET 自动增大）
+
+    Returns:
+        np.ndarray: RGB 像素数组 (N×3)，dtype 与 arr 相同
+    """
+    if arr.size == 0:
+        return arr[::sample_step, ::sample_step].reshape(-1, 3)
+
+    sample_step = _budget_sample_step(arr.shape[0], arr.shape[1], sample_step)
+
+    rows = len(range(0, arr.shape[0], sample_step))
+    cols = len(range(0, arr.shape[1], sample_step))
+    grid_size = rows * cols
+
+    # 布局: [采样网格 | 右边缘 | 下边缘]
+    pixels = np.empty((grid_size + rows + cols, 3), dtype=arr.dtype)
+    pixels[:grid_size].reshape(rows, cols, 3)[...] = arr[::sample_step, ::sample_step]
+    pixels[grid_size:grid_size + rows] = arr[::sample_step, -1]
+    pixels[grid_size + rows:] = arr[-1, ::sample_step]
+
+    return pixels
+
+
+def _image_to_rgb_array(image) -> np.ndarray | None:
+    """将 QImage、PIL Image 或像素数组转换为 (H×W×3) uint8 数组
+
+    QImage 需先于 PIL Image 判断：PIL Image 同样具有 width/height 属性（整数而非方法）
+
+    Args:
+        image: QImage、PIL Image 对象，或 (H×W×3)/(H×W×4) uint8 像素数组
+
+    Returns:
+        np.ndarray | None: RGB 像素数组，无法识别的对象返回 None
+    """
+    # 已是像素数组（如解码器输出的帧）：直接取前三个通道的视图，不做任何转换
+    if isinstance(image, np.ndarray):
+        if image.ndim == 3 and image.shape[2] >= 3:
+            return image[:, :, :3]
+        return None
+
+    # 处理 QImage
+    if hasattr(image, 'bits') and hasattr(image, 'width'):
+        return _qimage_to_numpy(image)
 
     # 处理 PIL Image
-    elif hasattr(image, 'size') and hasattr(image, 'getpixel'):
-        width, height = image.size
+    if hasattr(image, 'getpixel') and hasattr(image, 'convert'):
+        return np.asarray(image.convert('RGB'))
+
+    return None
 
-        if hasattr(image, 'convert'):
-            arr = np.array(image.convert('RGB'))
 
-            # 采样像素
-            sampled = arr[::sample_step, ::sample_step].reshape(-1, 3)
+def _extract_pixels_fast(image, sample_step: int = 4) -> np.ndarray:
+    """快速提取图片像素数据
 
-            # 合并边缘像素
-            if width > 0 and height > 0:
-                right_edge = arr[::sample_step, -1]
-                bottom_edge = arr[-1, ::sample_step]
-                edges = np.vstack([right_edge, bottom_edge])
-                return np.vstack([sampled, edges])
+    Args:
+        image: QImage、PIL Image 对象或 (H×W×3) uint8 像素数组
+        sample_step: 采样步长
 
-            return sampled
+    Returns:
+        np.ndarray: RGB 像素数组 (N×3)，dtype=np.uint8
+    """
+    arr = _image_to_rgb_array(image)
+    if arr is None:
+        return np.array([], dtype=np.uint8).reshape(0, 3)
 
-    return np.array([], dtype=np.uint8).reshape(0, 3)
+    return _sample_pixels_with_edges(arr, sample_step)
 
 
 def _kmeans_plus_plus_init(pixels: np.ndarray, k: int) -> np.ndarray:
@@ -1498,15 +1723,7 @@ def extract_dominant_colors_kmeans(
     count = max(3, min(8, count))
 
     if original_pixels is not None:
-        arr_sampled = original_pixels[::sample_step, ::sample_step].reshape(-1, 3)
-        # 合并边缘像素
-        if original_pixels.size > 0:
-            right_edge = original_pixels[::sample_step, -1]
-            bottom_edge = original_pixels[-1, ::sample_step]
-            edges = np.vstack([right_edge, bottom_edge])
-            pixels_np = np.vstack([arr_sampled, edges]).astype(np.float32)
-        else:
-            pixels_np = arr_sampled.astype(np.float32)
+        pixels_np = _sample_pixels_with_edges(original_pixels, sample_step).astype(np.float32)
     else:
         pixels_arr = _extract_pixels_fast(image, sample_step)
         pixels_np = pixels_arr.astype(np.float32)
@@ -1548,9 +1765,10 @@ def extract_dominant_colors(
     """提取图片主色调，支持 MMCQ 和 K-Means 两种算法
 
     Args:
-        image: QImage 或 PIL Image 对象
+        image: QImage、PIL Image 对象或 (H×W×3) uint8 像素数组
         count: 提取颜色数量 (3-8，默认5)
-        sample_step: 采样步长，每隔N个像素采样一次（默认4）
+        sample_step: 采样步长，每隔N个像素采样一次（默认4）；
+                     大图会自动增大步长，使采样像素不超过 _DOMINANT_SAMPLE_BUDGET
         original_pixels: 原始色彩空间像素数组 (H,W,3)，优先于 image 使用
         algorithm: 算法类型 ('mmcq' 或 'kmeans'，默认 'mmcq')
 
@@ -1565,30 +1783,46 @@ def extract_dominant_colors(
     count = max(3, min(8, count))
 
     if original_pixels is not None:
-        arr_sampled = original_pixels[::sample_step, ::sample_step].reshape(-1, 3)
-        # 合并边缘像素
-        if original_pixels.size > 0:
-            right_edge = original_pixels[::sample_step, -1]
-            bottom_edge = original_pixels[-1, ::sample_step]
-            edges = np.vstack([right_edge, bottom_edge])
-            pixels = np.vstack([arr_sampled, edges])
-        else:
-            pixels = arr_sampled
+        pixels = _sample_pixels_with_edges(original_pixels, sample_step)
     else:
         pixels = _extract_pixels_fast(image, sample_step)
 
     if len(pixels) == 0:
         return []
 
-    # 转换为 int32 用于 MMCQ
-    pixels_int32 = pixels.astype(np.int32)
-    cubes = _mmcq_quantize(pixels_int32, count)
+    cubes = _mmcq_quantize(pixels, count)
     cubes.sort(key=lambda c: c.get_count(), reverse=True)
     dominant_colors = [cube.get_average_color() for cube in cubes]
 
     return dominant_colors
 
 
+def _stack_pixels_with_positions(arr: np.ndarray, sample_step: int) -> np.ndarray:
+    """按步长采样像素并附加坐标
+
+    直接写入预分配的输出数组，不生成坐标网格和中间数组
+
+    Args:
+        arr: RGB 像素数组 (H×W×3)
+        sample_step: 采样步长（下限，大图按 _DOMINANT_SAMPLE_BUDGET 自动增大）
+
+    Returns:
+        np.ndarray: (N×5) int32 数组，列顺序: x, y, r, g, b
+    """
+    height, width = arr.shape[:2]
+    sample_step = _budget_sample_step(height, width, sample_step)
+    ys = np.arange(0, height, sample_step, dtype=np.int32)
+    xs = np.arange(0, width, sample_step, dtype=np.int32)
+
+    pixel_data = np.empty((len(ys) * len(xs), 5), dtype=np.int32)
+    grid = pixel_data.reshape(len(ys), len(xs), 5)
+    grid[:, :, 0] = xs
+    grid[:, :, 1] = ys[:, np.newaxis]
+    grid[:, :, 2:5] = arr[::sample_step, ::sample_step, :3]
+
+    return pixel_data
+
+
 def _extract_pixels_with_positions_fast(
     image,
     sample_step: int = 4
@@ -1596,65 +1830,19 @@ def _extract_pixels_with_positions_fast(
     """快速提取图片像素数据及其位置
 
     Args:
-        image: QImage 或 PIL Image 对象
+        image: QImage、PIL Image 对象或 (H×W×3) uint8 像素数组
         sample_step: 采样步长
 
     Returns:
         tuple: (width, height, pixel_data) 其中 pixel_data 是 (N×5) 数组
                列顺序: x, y, r, g, b
     """
-    width, height = 0, 0
+    arr = _image_to_rgb_array(image)
+    if arr is None:
+        return 0, 0, np.array([], dtype=np.int32).reshape(0, 5)
 
-    # 处理 QImage
-    if hasattr(image, 'width') and hasattr(image, 'height'):
-        width = image.width()
-        height = image.height()
-
-        if hasattr(image, 'bits'):
-            arr = _qimage_to_numpy(image)
-
-            # 使用 numpy 生成坐标网格
-            ys = np.arange(0, height, sample_step)
-            xs = np.arange(0, width, sample_step)
-            y_grid, x_grid = np.meshgrid(ys, xs, indexing='ij')
-
-            # 扁平化坐标
-            x_flat = x_grid.ravel()
-            y_flat = y_grid.ravel()
-
-            # 获取对应像素
-            pixels_flat = arr[::sample_step, ::sample_step].reshape(-1, 3)
-
-            # 合并为 (x, y, r, g, b) 数组
-            pixel_data = np.column_stack([x_flat, y_flat, pixels_flat])
-
-            return width, height, pixel_data.astype(np.int32)
-
-    # 处理 PIL Image
-    elif hasattr(image, 'size') and hasattr(image, 'getpixel'):
-        width, height = image.size
-
-        if hasattr(image, 'convert'):
-            arr = np.array(image.convert('RGB'))
-
-            # 使用 numpy 生成坐标网格
-            ys = np.arange(0, height, sample_step)
-            xs = np.arange(0, width, sample_step)
-            y_grid, x_grid = np.meshgrid(ys, xs, indexing='ij')
-
-            # 扁平化坐标
-            x_flat = x_grid.ravel()
-            y_flat = y_grid.ravel()
-
-            # 获取对应像素
-            pixels_flat = arr[::sample_step, ::sample_step].reshape(-1, 3)
-
-            # 合并为 (x, y, r, g, b) 数组
-            pixel_data = np.column_stack([x_flat, y_flat, pixels_flat])
-
-            return width, height, pixel_data.astype(np.int32)
-
-    return width, height, np.array([], dtype=np.int32).reshape(0, 5)
+    height, width = arr.shape[:2]
+    return width, height, _stack_pixels_with_positions(arr, sample_step)
 
 
 def find_dominant_color_positions(
@@ -1666,9 +1854,9 @@ def find_dominant_color_positions(
     """找到每种主色调在图片中的代表性位置
 
     Args:
-        image: QImage 或 PIL Image 对象
+        image: QImage、PIL Image 对象或 (H×W×3) uint8 像素数组
         dominant_colors: 主色调列表 [(r, g, b), ...]
-        sample_step: 采样步长（默认4）
+        sample_step: 采样步长（默认4）；大图会自动增大步长，使采样像素不超过 _DOMINANT_SAMPLE_BUDGET
         original_pixels: 原始色彩空间像素数组 (H,W,3)，优先于 image 使用
 
     Returns:
@@ -1679,45 +1867,42 @@ def find_dominant_color_positions(
 
     if original_pixels is not None:
         height, width = original_pixels.shape[:2]
-        arr = original_pixels[::sample_step, ::sample_step]
-        ys, xs = np.mgrid[0:height:sample_step, 0:width:sample_step]
-
-        # 使用 numpy 列向量合并
-        x_flat = xs.ravel()
-        y_flat = ys.ravel()
-        pixels_flat = arr.reshape(-1, 3)
-        pixel_data = np.column_stack([x_flat, y_flat, pixels_flat]).astype(np.float32)
+        pixel_data = _stack_pixels_with_positions(original_pixels, sample_step)
     else:
         width, height, pixel_data = _extract_pixels_with_positions_fast(image, sample_step)
-        pixel_data = pixel_data.astype(np.float32)
 
     if len(pixel_data) == 0 or width == 0 or height == 0:
         return [(0.5, 0.5)] * len(dominant_colors)
 
     dominant_array = np.array(dominant_colors, dtype=np.float32)
 
-    pixel_colors = pixel_data[:, 2:5]
+    # 坐标保持 int32，只有参与矩阵乘法的颜色列转换为 float32
+    # （0-255 的整数平方和远小于 2^24，float32 下距离仍是精确值）
+    pixel_colors = pixel_data[:, 2:5].astype(np.float32)
 
     # 展开式: ||p-c||^2 = ||p||^2 - 2*p.c + ||c||^2，矩阵乘法避免 (N,k,3) 中间数组
-    color_norms = np.sum(pixel_colors * pixel_colors, axis=1)
+    # ||p||^2 对同一像素的所有主色相同，不影响 argmin，因此省略；
+    # 在矩阵乘积结果上原地运算，只分配一个 (N,k) 数组
     dominant_norms = np.sum(dominant_array * dominant_array, axis=1)
-    distances = color_norms[:, np.newaxis] - 2 * (pixel_colors @ dominant_array.T) + dominant_norms
+    distances = pixel_colors @ dominant_array.T
+    distances *= -2
+    distances += dominant_norms
 
     closest_indices = np.argmin(distances, axis=1)
 
-    positions = []
-    for i in range(len(dominant_colors)):
-        mask = closest_indices == i
-        cluster = pixel_data[mask]
+    # 按归属主色分组累加坐标：bincount 只需遍历一次，替代逐个主色的掩码筛选
+    k = len(dominant_colors)
+    counts = np.bincount(closest_indices, minlength=k)
+    sum_x = np.bincount(closest_indices, weights=pixel_data[:, 0], minlength=k)
+    sum_y = np.bincount(closest_indices, weights=pixel_data[:, 1], minlength=k)
 
-        if len(cluster) > 0:
-            avg_x = cluster[:, 0].mean()
-            avg_y = cluster[:, 1].mean()
-            positions.append((avg_x / width, avg_y / height))
-        else:
-            positions.append((0.5, 0.5))
+    # 没有像素归属的主色使用图片中心
+    matched = counts > 0
+    safe_counts = np.maximum(counts, 1)
+    rel_x = np.where(matched, sum_x / safe_counts / width, 0.5)
+    rel_y = np.where(matched, sum_y / safe_counts / height, 0.5)
 
-    return positions
+    return list(zip(rel_x.tolist(), rel_y.tolist()))
 
 
 # ==================== RYB 色彩空间支持 ====================
@@ -1791,6 +1976,25 @@ def ryb_hue_to_rgb_hue(ryb_hue: float) -> float:
         return hue
 
 
+def _ryb_hues_to_rgb_hues(ryb_hues: np.ndarray) -> np.ndarray:
+    """批量将 RYB 色相转换为 RGB 色相
+
+    与 ryb_hue_to_rgb_hue 使用相同的分段公式与运算顺序，结果逐位一致
+
+    Args:
+        ryb_hues: RYB色相数组 (0-360)
+
+    Returns:
+        np.ndarray: RGB色相数组 (0-360)，float64
+    """
+    hue = np.asarray(ryb_hues, dtype=np.float64) % 360
+    return np.select(
+        [hue <= 120, hue <= 180, hue <= 210, hue <= 240],
+        [hue * 0.5, 60 + (hue - 120), 120 + (hue - 180) * 2, 180 + (hue - 210) * 2],
+        default=hue
+    )
+
+
 # ========== RYB配色方案公共API ==========
 
 def generate_ryb_monochromatic(ryb_hue: float, count: int = 4, base_saturation: float = 100) -> list[tuple[float, float, float]]:
@@ -1823,7 +2027,10 @@ def generate_ryb_analogous(ryb_hue: float, angle: float = 30, count: int = 4, ba
     # 在RYB空间计算邻近色相
     ryb_hues = _calculate_analogous_hues(ryb_hue, angle, count)
     # 转换为RGB色相
-    rgb_hues = [ryb_hue_to_rgb_hue(h) for h in ryb_hues]
+    if count >= _VECTORIZE_MIN_COUNT:
+        rgb_hues = _ryb_hues_to_rgb_hues(ryb_hues).tolist()
+    else:
+        rgb_hues = [ryb_hue_to_rgb_hue(h) for h in ryb_hues]
     return _build_analogous_colors(rgb_hues, base_saturation)
 
 
@@ -1933,9 +2140,9 @@ def get_scheme_preview_colors_ryb(
     # 尝试从缓存获取
     if use_cache:
         cache = get_color_scheme_cache()
-        cached_hsb = cache.get(cache_key_type, base_hue, count, base_saturation)
-        if cached_hsb is not None:
-            return [hsb_to_rgb(h, s, b) for h, s, b in cached_hsb]
+        cached_rgb = cache.get(cache_key_type, base_hue, count, base_saturation)
+        if cached_rgb is not None:
+            return list(cached_rgb)
 
     # 先将 RGB 色相转换为 RYB 色相
     ryb_hue = rgb_hue_to_ryb_hue(base_hue)
@@ -1954,8 +2161,10 @@ def get_scheme_preview_colors_ryb(
     else:
         hsb_colors = generate_ryb_monochromatic(ryb_hue, count, base_saturation)
 
-    # 存入缓存
+    rgb_colors = _hsb_colors_to_rgb(hsb_colors)
+
+    # 存入缓存（缓存转换后的RGB结果，命中时无需再做HSB转RGB）
     if use_cache:
-        cache.set(cache_key_type, base_hue, count, base_saturation, hsb_colors)
+        cache.set(cache_key_type, base_hue, count, base_saturation, tuple(rgb_colors))
 
-    return [hsb_to_rgb(h, s, b) for h, s, b in hsb_colors]
+    return rgb_colors
@@ -6,6 +6,19 @@ import random
 import sys
 from typing import Any
 
+# 第三方库导入（可选）：安装了 orjson 时使用其更快的解析器，否则回退到标准库 json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 项目模块导入
+from .logger import get_logger
+
+
+logger = get_logger("color_data")
+
 
 def get_base_path() -> str:
     """获取应用程序基础路径
@@ -26,9 +39,13 @@ def get_base_path() -> str:
 
 class ColorSource:
     """配色源类（直接读取新格式JSON）"""
-    
+
+    __slots__ = (
+        '_id', '_name', '_description', '_author', '_category',
+        '_palettes', '_groups', '_group_palettes',
+    )
+
     def __init__(self, json_data: dict[str, Any]):
-        self._data = json_data
         self._id = json_data.get("id", "")
         self._name = json_data.get("name", "")
         self._description = json_data.get("description", "")
@@ -36,6 +53,8 @@ class ColorSource:
         self._category = json_data.get("category", "")
         self._palettes = json_data.get("palettes", [])
         self._groups = json_data.get("groups", [])
+        # 分组配色列表缓存：{分组索引: 配色列表}，数据加载后不再变化，按需解析一次
+        self._group_palettes: dict[int, list[dict[str, Any]]] = {}
     
     @property
     def id(self) -> str:
@@ -88,8 +107,12 @@ class ColorSource:
         """
         if group_index < 0 or group_index >= len(self._groups):
             return self._palettes
-        indices = self._groups[group_index].get("indices", [])
-        return [self._palettes[i] for i in indices if i < len(self._palettes)]
+        palettes = self._group_palettes.get(group_index)
+        if palettes is None:
+            indices = self._groups[group_index].get("indices", [])
+            palettes = [self._palettes[i] for i in indices if i < len(self._palettes)]
+            self._group_palettes[group_index] = palettes
+        return palettes
     
     def get_all_palettes(self) -> list[dict[str, Any]]:
         """获取所有配色（无分组时使用）
@@ -133,14 +156,8 @@ class ColorSource:
         Returns:
             list: 配色列表
         """
-        if group_index < 0 or group_index >= len(self._groups):
-            palettes = self._palettes
-        else:
-            indices = self._groups[group_index].get("indices", [])
-            palettes = [self._palettes[i] for i in indices if i < len(self._palettes)]
-        
-        end = min(start + count, len(palettes))
-        return palettes[start:end]
+        palettes = self.get_palettes_for_group(group_index)
+        return palettes[start:start + count]
 
 
 class ColorSourceRegistry:
@@ -149,6 +166,7 @@ class ColorSourceRegistry:
     _instance = None
     _sources = {}
     _loaded = False
+    _unified_palettes = None
     
     @classmethod
     def get_instance(cls):
@@ -170,20 +188,24 @@ class ColorSourceRegistry:
         base_path = get_base_path()
         color_data_dir = os.path.join(base_path, 'color_data')
         
-        if not os.path.exists(color_data_dir):
+        try:
+            # scandir 的目录项自带完整路径与文件类型，无需逐个拼接路径或额外 stat
+            entries = list(os.scandir(color_data_dir))
+        except OSError:
             return
         
-        for filename in os.listdir(color_data_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(color_data_dir, filename)
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file():
                 try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    # 以字节读取，orjson 与 json.loads 都可直接解析 UTF-8 字节
+                    with open(entry.path, 'rb') as f:
+                        data = _json_loads(f.read())
                     if 'id' in data and 'palettes' in data:
                         source = ColorSource(data)
                         ColorSourceRegistry._sources[source.id] = source
-                except (OSError, json.JSONDecodeError) as e:
-                    print(f"加载配色源失败 {filename}: {e}")
+                except (OSError, ValueError) as e:
+                    # json.JSONDecodeError 与 orjson.JSONDecodeError 均为 ValueError 子类
+                    logger.error(f"加载配色源失败: file={entry.name}, error={e}")
     
     def get(self, source_id: str) -> ColorSource:
         """获取指定配色源
@@ -215,6 +237,34 @@ class ColorSourceRegistry:
         self._ensure_loaded()  # 首次访问时才加载
         return list(ColorSourceRegistry._sources.values())
 
+    def get_unified_palettes(self) -> list:
+        """获取所有配色源的统一格式配色列表
+
+        配色数据加载后不再变化，统一格式列表只在首次访问时构建一次
+
+        Returns:
+            list: 配色组字典列表（共享的缓存列表，调用方不应修改）
+        """
+        if ColorSourceRegistry._unified_palettes is None:
+            ColorSourceRegistry._unified_palettes = self._build_unified_palettes()
+        return ColorSourceRegistry._unified_palettes
+
+    def _build_unified_palettes(self) -> list:
+        """将所有配色源转换为统一的配色组格式"""
+        unified_palettes = []
+        for source in self.get_all_sources():
+            for i, palette in enumerate(source.get_all_palettes()):
+                colors = palette.get("colors", [])
+                if colors:
+                    unified_palettes.append({
+                        "id": f"{source.id}_{i}",
+                        "name": palette.get("name", f"配色 #{i+1}"),
+                        "source": source.id,
+                        "colors": colors,
+                        "color_count": len(colors)
+                    })
+        return unified_palettes
+
 
 def get_color_source_registry() -> ColorSourceRegistry:
     """获取配色源注册表单例
@@ -261,19 +311,7 @@ def get_all_palettes():
                 "color_count": 颜色数量
             }
     """
-    all_palettes = []
-    for source in get_all_color_sources():
-        for i, palette in enumerate(source.get_all_palettes()):
-            colors = palette.get("colors", [])
-            if colors:
-                all_palettes.append({
-                    "id": f"{source.id}_{i}",
-                    "name": palette.get("name", f"配色 #{i+1}"),
-                    "source": source.id,
-                    "colors": colors,
-                    "color_count": len(colors)
-                })
-    return all_palettes
+    return list(get_color_source_registry().get_unified_palettes())
 
 
 def get_random_palettes(count: int = 10) -> list[dict[str, Any]]:
@@ -285,13 +323,13 @@ def get_random_palettes(count: int = 10) -> list[dict[str, Any]]:
     Returns:
         list[dict[str, Any]]: 随机选择的配色组列表
     """
-    all_palettes = get_all_palettes()
+    all_palettes = get_color_source_registry().get_unified_palettes()
     total = len(all_palettes)
     
     if total == 0:
         return []
     
     if count >= total:
-        return all_palettes
+        return list(all_palettes)
     
     return random.sample(all_palettes, count)
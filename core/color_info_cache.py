@@ -0,0 +1,87 @@
+from __future__ import annotations
+# 标准库导入
+from typing import Any
+
+# 项目模块导入
+from .cache_base import BaseCache
+
+
+class ColorInfoCache(BaseCache):
+    """颜色信息缓存管理器
+
+    使用LRU(最近最少使用)策略缓存 get_color_info 的转换结果，
+    悬停取色等场景会反复查询同一颜色，命中时无需重新计算各色彩空间数值。
+
+    缓存键格式: (r, g, b, colorspace_name)
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """初始化颜色信息缓存管理器
+
+        Args:
+            max_size: 最大缓存条目数，默认1024
+        """
+        super().__init__(max_size)
+
+    def get(self, r: int, g: int, b: int, colorspace_name: str) -> Any | None:
+        """获取缓存的颜色信息
+
+        Args:
+            r: 红色通道值 (0-255)
+            g: 绿色通道值 (0-255)
+            b: 蓝色通道值 (0-255)
+            colorspace_name: 色彩空间名称
+
+        Returns:
+            Any | None: 缓存的颜色信息，如果缓存未命中则返回None
+        """
+        return self._get_from_cache(self._get_key(r, g, b, colorspace_name))
+
+    def set(self, r: int, g: int, b: int, colorspace_name: str, info: Any) -> None:
+        """存储颜色信息到缓存
+
+        Args:
+            r: 红色通道值 (0-255)
+            g: 绿色通道值 (0-255)
+            b: 蓝色通道值 (0-255)
+            colorspace_name: 色彩空间名称
+            info: 颜色信息（不可变对象）
+        """
+        self._set_to_cache(self._get_key(r, g, b, colorspace_name), info)
+
+    def _get_key(self, r: int, g: int, b: int, colorspace_name: str) -> tuple:
+        """生成缓存键
+
+        Args:
+            r: 红色通道值 (0-255)
+            g: 绿色通道值 (0-255)
+            b: 蓝色通道值 (0-255)
+            colorspace_name: 色彩空间名称
+
+        Returns:
+            tuple: 缓存键元组
+        """
+        return (r, g, b, colorspace_name)
+
+
+# 全局缓存实例
+_color_info_cache: ColorInfoCache | None = None
+
+
+def get_color_info_cache() -> ColorInfoCache:
+    """获取全局颜色信息缓存实例
+
+    Returns:
+        ColorInfoCache: 全局颜色信息缓存实例
+    """
+    global _color_info_cache
+    if _color_info_cache is None:
+        _color_info_cache = ColorInfoCache()
+    return _color_info_cache
+
+
+def clear_color_info_cache() -> None:
+    """清空全局颜色信息缓存"""
+    global _color_info_cache
+    if _color_info_cache is not None:
+        _color_info_cache.clear()
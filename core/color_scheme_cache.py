@@ -12,8 +12,9 @@ class ColorSchemeCache(BaseCache):
     使用LRU(最近最少使用)策略管理配色计算结果的缓存，
     避免相同参数的配色计算重复执行，提升响应速度。
 
-    缓存键格式: (scheme_type, hue_rounded, count, saturation_rounded)
-    色相值四舍五入到小数点后1位，平衡缓存命中率和精度。
+    缓存键格式: (scheme_type, hue_tenths, count, saturation_rounded)
+    色相量化为整数的0.1度单位，平衡缓存命中率和精度。
+    缓存值为已转换的RGB预览颜色元组，命中时无需重新计算和转换。
     """
 
     def __init__(self, max_size: int = 100):
@@ -30,7 +31,7 @@ class ColorSchemeCache(BaseCache):
         hue: float,
         count: int,
         saturation: float
-    ) -> list[tuple[float, float, float]] | None:
+    ) -> tuple[tuple[int, int, int], ...] | None:
         """获取缓存的配色计算结果
 
         Args:
@@ -40,7 +41,7 @@ class ColorSchemeCache(BaseCache):
             saturation: 基准饱和度 (0-100)
 
         Returns:
-            list[tuple[float, float, float]] | None: 缓存的HSB颜色列表，
+            tuple[tuple[int, int, int], ...] | None: 缓存的RGB颜色元组，
             如果缓存未命中则返回None
         """
         key = self._get_key(scheme_type, hue, count, saturation)
@@ -52,7 +53,7 @@ class ColorSchemeCache(BaseCache):
         hue: float,
         count: int,
         saturation: float,
-        colors: list[tuple[float, float, float]]
+        colors: tuple[tuple[int, int, int], ...]
     ) -> None:
         """存储配色计算结果到缓存
 
@@ -61,7 +62,7 @@ class ColorSchemeCache(BaseCache):
             hue: 基础色相 (0-360)
             count: 生成颜色数量
             saturation: 基准饱和度 (0-100)
-            colors: HSB颜色列表
+            colors: RGB颜色元组（不可变，避免调用方修改缓存内容）
         """
         key = self._get_key(scheme_type, hue, count, saturation)
         self._set_to_cache(key, colors)
@@ -75,8 +76,9 @@ class ColorSchemeCache(BaseCache):
     ) -> tuple:
         """生成缓存键
 
-        色相值四舍五入到小数点后1位，饱和度四舍五入到整数，
-        在保证配色质量的同时提高缓存命中率。
+        色相量化为0.1度单位的整数，饱和度四舍五入到整数，
+        在保证配色质量的同时提高缓存命中率。键全部为整数，
+        避免浮点键的相等性问题，且整数的取整与哈希都更快。
 
         Args:
             scheme_type: 配色方案类型
@@ -87,12 +89,12 @@ class ColorSchemeCache(BaseCache):
         Returns:
             tuple: 缓存键元组
         """
-        # 色相精度：0.1度
-        hue_rounded = round(hue, 1)
+        # 色相精度：0.1度（以 0.1 度为单位的整数）
+        hue_tenths = round(hue * 10)
         # 饱和度精度：1%
         saturation_rounded = round(saturation)
 
-        return (scheme_type, hue_rounded, count, saturation_rounded)
+        return (scheme_type, hue_tenths, count, saturation_rounded)
 
 
 # 全局缓存实例
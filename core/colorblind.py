@@ -6,6 +6,12 @@
 
 from __future__ import annotations
 
+# 第三方库导入
+import numpy as np
+
+# 项目模块导入
+from .color import _SRGB2LIN
+
 # 色盲类型定义
 COLORBLIND_TYPES = {
     'normal': {
@@ -89,11 +95,12 @@ def _apply_matrix(v: tuple[float, float, float], m: list[list[float]]) -> tuple[
     )
 
 
-def _gamma_linearize(c: float) -> float:
-    """sRGB 非线性通道 → 线性通道"""
-    if c <= 0.04045:
-        return c / 12.92
-    return ((c + 0.055) / 1.055) ** 2.4
+def _multiply_matrices(a: list[list[float]], b: list[list[float]]) -> list[list[float]]:
+    """3x3 矩阵乘法 a @ b"""
+    return [
+        [a[i][0] * b[0][j] + a[i][1] * b[1][j] + a[i][2] * b[2][j] for j in range(3)]
+        for i in range(3)
+    ]
 
 
 def _gamma_delinearize(c: float) -> float:
@@ -103,45 +110,77 @@ def _gamma_delinearize(c: float) -> float:
     return 1.055 * (c ** (1.0 / 2.4)) - 0.055
 
 
-def _interpolate_matrix(full_matrix: list[list[float]], severity: float) -> list[list[float]]:
-    """在单位矩阵和完全缺失矩阵之间做线性插值
+# sRGB 通道输入均为 0-255 整数，线性化直接使用 core.color 的 256 项查找表；
+# 数组路径使用同一张表的 NumPy 副本按索引查表
+_SRGB2LIN_ARRAY = np.array(_SRGB2LIN, dtype=np.float64)
+
+
+def _interpolate_matrix(
+    start_matrix: list[list[float]],
+    end_matrix: list[list[float]],
+    severity: float
+) -> list[list[float]]:
+    """在两个矩阵之间做线性插值
 
     Args:
-        full_matrix: severity=1.0 时的完全缺失矩阵
+        start_matrix: severity=0.0 时的矩阵
+        end_matrix: severity=1.0 时的矩阵
         severity: 严重程度 (0.0-1.0)
 
     Returns:
         插值后的 3x3 矩阵
     """
-    result = [[0.0] * 3 for _ in range(3)]
-    for i in range(3):
-        for j in range(3):
-            identity = 1.0 if i == j else 0.0
-            result[i][j] = identity * (1.0 - severity) + full_matrix[i][j] * severity
-    return result
+    return [
+        [start * (1.0 - severity) + end * severity for start, end in zip(start_row, end_row)]
+        for start_row, end_row in zip(start_matrix, end_matrix)
+    ]
 
 
-def _get_blind_matrix(cvd_type: str, severity: float) -> list[list[float]] | None:
-    """根据色盲类型和严重程度获取最终变换矩阵
+def _fuse_blind_matrix(matrix: list[list[float]]) -> list[list[float]]:
+    """将 线性RGB → LMS、色盲变换、LMS → 线性RGB 三个矩阵合并为一个 3x3 矩阵"""
+    return _multiply_matrices(
+        MACHADO_RGB_FROM_LMS, _multiply_matrices(matrix, MACHADO_LMS_FROM_RGB)
+    )
+
+
+# 色盲类型 → Machado 矩阵键
+_CVD_MATRIX_KEYS = {
+    'protanopia': 'protan',
+    'protanomaly': 'protan',
+    'deuteranopia': 'deutan',
+    'deuteranomaly': 'deutan',
+    'tritanopia': 'tritan',
+    'tritanomaly': 'tritan',
+}
+
+# 合并矩阵均为常量，导入时计算一次：
+# severity=0 对应的单位变换，以及各类型 severity=1.0 的完全缺失变换
+_FUSED_IDENTITY = _multiply_matrices(MACHADO_RGB_FROM_LMS, MACHADO_LMS_FROM_RGB)
+_FUSED_MATRICES = {
+    matrix_key: _fuse_blind_matrix(matrix)
+    for matrix_key, matrix in MACHADO_MATRICES.items()
+}
+
+
+def _get_fused_matrix(cvd_type: str, severity: float) -> list[list[float]] | None:
+    """获取 线性RGB → LMS → 色盲LMS → 线性RGB 合并后的单个 3x3 矩阵
 
     Args:
         cvd_type: 色盲类型标识
         severity: 严重程度 (0.0-1.0)，仅对 anomal 类型生效
 
     Returns:
-        3x3 变换矩阵，normal/achromatopsia 返回 None
+        合并后的 3x3 矩阵，normal/achromatopsia 返回 None
     """
-    if cvd_type in ('protanopia', 'protanomaly'):
-        matrix_key = 'protan'
-    elif cvd_type in ('deuteranopia', 'deuteranomaly'):
-        matrix_key = 'deutan'
-    elif cvd_type in ('tritanopia', 'tritanomaly'):
-        matrix_key = 'tritan'
-    else:
+    matrix_key = _CVD_MATRIX_KEYS.get(cvd_type)
+    if matrix_key is None:
         return None
 
-    actual_severity = 1.0 if cvd_type.endswith('opia') else severity
-    return _interpolate_matrix(MACHADO_MATRICES[matrix_key], actual_severity)
+    fused = _FUSED_MATRICES[matrix_key]
+    if cvd_type.endswith('opia'):
+        return fused
+    # 插值与矩阵乘法可交换，anomal 类型直接在两个预合并矩阵之间插值
+    return _interpolate_matrix(_FUSED_IDENTITY, fused, severity)
 
 
 def simulate_colorblind(
@@ -181,23 +220,16 @@ def simulate_colorblind(
     if severity < 0.001:
         return rgb
 
-    matrix = _get_blind_matrix(cvd_type, severity)
+    matrix = _get_fused_matrix(cvd_type, severity)
     if matrix is None:
         return rgb
 
-    r_norm = R / 255.0
-    g_norm = G / 255.0
-    b_norm = B / 255.0
-
-    r_lin = _gamma_linearize(r_norm)
-    g_lin = _gamma_linearize(g_norm)
-    b_lin = _gamma_linearize(b_norm)
-
-    lms = _apply_matrix((r_lin, g_lin, b_lin), MACHADO_LMS_FROM_RGB)
-
-    lms_blind = _apply_matrix(lms, matrix)
+    r_lin = _SRGB2LIN[R]
+    g_lin = _SRGB2LIN[G]
+    b_lin = _SRGB2LIN[B]
 
-    rgb_lin = _apply_matrix(lms_blind, MACHADO_RGB_FROM_LMS)
+    # RGB → LMS → 色盲LMS → RGB 已合并为单个矩阵，只需一次 3x3 变换
+    rgb_lin = _apply_matrix((r_lin, g_lin, b_lin), matrix)
 
     r_out = _gamma_delinearize(rgb_lin[0])
     g_out = _gamma_delinearize(rgb_lin[1])
@@ -210,6 +242,62 @@ def simulate_colorblind(
     )
 
 
+def simulate_colorblind_array(
+    rgb: np.ndarray,
+    cvd_type: str = 'normal',
+    severity: float = 0.5
+) -> np.ndarray:
+    """批量模拟指定类型的色盲效果（向量化版本）
+
+    与 simulate_colorblind 逐像素结果完全一致，适用于整幅图像或大量颜色的模拟。
+    非 uint8 输入先四舍五入并裁剪到 0-255。
+
+    Args:
+        rgb: RGB 数组，形状为 (..., 3)，范围 0-255，例如 (H, W, 3) 的图像或 (N, 3) 的颜色列表
+        cvd_type: 色盲类型，可选值同 simulate_colorblind
+        severity: 严重程度 0.0-1.0，仅对 anomal 类型生效
+
+    Returns:
+        np.ndarray: 模拟后的 uint8 RGB 数组，形状与输入相同
+    """
+    rgb = np.asarray(rgb)
+    if rgb.shape[-1] != 3:
+        raise ValueError(f"RGB 数组最后一维必须为 3，实际为 {rgb.shape[-1]}")
+    if rgb.dtype != np.uint8:
+        # 越界值直接转换为 uint8 会回绕（如 -1 → 255），先裁剪到有效范围
+        rgb = np.clip(np.rint(rgb), 0, 255).astype(np.uint8)
+
+    if cvd_type == 'achromatopsia':
+        channels = rgb.astype(np.float64)
+        gray = (0.299 * channels[..., 0] + 0.587 * channels[..., 1] + 0.114 * channels[..., 2])
+        return np.repeat(gray.astype(np.uint8)[..., np.newaxis], 3, axis=-1)
+
+    matrix = None
+    if cvd_type != 'normal' and severity >= 0.001:
+        matrix = _get_fused_matrix(cvd_type, severity)
+    if matrix is None:
+        return rgb.astype(np.uint8)
+
+    linear = _SRGB2LIN_ARRAY[rgb]
+
+    # 三个矩阵已合并为一个，每个像素只需一次 3x3 变换；
+    # 按与 _apply_matrix 相同的顺序逐项相加，保证与标量版本逐位一致
+    r_lin, g_lin, b_lin = linear[..., 0], linear[..., 1], linear[..., 2]
+    linear_out = np.stack([
+        row[0] * r_lin + row[1] * g_lin + row[2] * b_lin
+        for row in matrix
+    ], axis=-1)
+
+    # 负值先置零：其结果本就会被裁剪为 0，同时避免对负数开方
+    linear_out = np.maximum(linear_out, 0.0)
+    out = np.where(
+        linear_out <= 0.0031308,
+        linear_out * 12.92,
+        1.055 * linear_out ** (1.0 / 2.4) - 0.055
+    )
+    return np.clip(out * 255, 0, 255).astype(np.uint8)
+
+
 def get_colorblind_info(colorblind_type: str) -> dict[str, str]:
     """获取色盲类型的信息
 
@@ -46,6 +46,10 @@ class ConfigManager:
         """初始化配置管理器"""
         self._config_path: Path = self._get_config_path()
         self._config: dict[str, Any] = {}
+        # 上次成功加载时配置文件的修改时间，未变化时 load() 不再重复解析
+        self._loaded_mtime: int | None = None
+        # 配置目录是否已确认存在，避免每次保存都调用 mkdir
+        self._config_dir_ready: bool = False
         self._load_default_config()
 
     def _get_config_path(self) -> Path:
@@ -59,8 +63,11 @@ class ConfigManager:
 
     def _ensure_config_dir(self) -> None:
         """确保配置目录存在"""
+        if self._config_dir_ready:
+            return
         config_dir = self._config_path.parent
         config_dir.mkdir(parents=True, exist_ok=True)
+        self._config_dir_ready = True
 
     def _load_default_config(self) -> None:
         """加载默认配置"""
@@ -99,21 +106,32 @@ class ConfigManager:
             "scene_templates": {}
         }
 
-    def load(self) -> dict[str, Any]:
+    def load(self, reload: bool = False) -> dict[str, Any]:
         """从文件加载配置
 
+        配置文件自上次加载后未被修改时直接返回内存中的配置，不再重复解析。
+
+        Args:
+            reload: 是否强制重新读取配置文件
+
         Returns:
             dict[str, Any]: 加载的配置字典
         """
-        if not self._config_path.exists():
+        try:
+            mtime = self._config_path.stat().st_mtime_ns
+        except OSError:
             logger.info("配置文件不存在，使用默认配置")
             return self._config
 
+        if not reload and mtime == self._loaded_mtime:
+            return self._config
+
         try:
             with open(self._config_path, 'r', encoding='utf-8') as f:
                 loaded_config = json.load(f)
 
             self._merge_config(self._config, loaded_config)
+            self._loaded_mtime = mtime
             
             version = self._config.get("version", "unknown")
             logger.info(f"配置加载完成: version={version}")
@@ -163,12 +181,22 @@ class ConfigManager:
         self._ensure_config_dir()
 
         try:
-            with open(self._config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, ensure_ascii=False, indent=4)
+            try:
+                self._write_config_file()
+            except FileNotFoundError:
+                # 配置目录可能已被外部删除：重新创建后重试一次
+                self._config_dir_ready = False
+                self._ensure_config_dir()
+                self._write_config_file()
             logger.debug("配置保存完成")
         except (IOError, OSError) as e:
             logger.error(f"保存配置文件失败: error={e}")
 
+    def _write_config_file(self) -> None:
+        """将当前配置写入配置文件"""
+        with open(self._config_path, 'w', encoding='utf-8') as f:
+            json.dump(self._config, f, ensure_ascii=False, indent=4)
+
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置项
 
@@ -0,0 +1,238 @@
+"""测试 core.color 中的基础颜色转换函数
+
+验证 HEX / RGB 等转换的正确性与边界输入处理
+"""
+from __future__ import annotations
+
+import sys
+import os
+
+# 添加项目根目录到 Python 路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import numpy as np
+import pytest
+import core.color as color_module
+from core.color import (
+    hex_to_rgb,
+    rgb_to_hex,
+    generate_monochromatic,
+    generate_analogous,
+    generate_complementary,
+    generate_split_complementary,
+    generate_double_complementary,
+    generate_ryb_monochromatic,
+    generate_ryb_complementary,
+    generate_ryb_split_complementary,
+    generate_ryb_double_complementary,
+    hsb_to_rgb,
+    get_color_info,
+    get_scheme_preview_colors,
+    get_scheme_preview_colors_ryb,
+    generate_ryb_analogous,
+    rgb_hue_to_ryb_hue,
+    ryb_hue_to_rgb_hue,
+    _hsb_to_rgb_batch,
+    _ryb_hues_to_rgb_hues,
+    MIN_SATURATION,
+)
+from core.color_scheme_cache import ColorSchemeCache
+
+
+class TestHexToRgb:
+    """测试 hex_to_rgb"""
+
+    def test_basic_values(self):
+        """测试常见颜色"""
+        assert hex_to_rgb('#FF0000') == (255, 0, 0)
+        assert hex_to_rgb('#00FF00') == (0, 255, 0)
+        assert hex_to_rgb('#0000FF') == (0, 0, 255)
+        assert hex_to_rgb('#000000') == (0, 0, 0)
+        assert hex_to_rgb('#FFFFFF') == (255, 255, 255)
+
+    def test_prefix_case_and_whitespace(self):
+        """测试无前缀、小写及首尾空白"""
+        assert hex_to_rgb('ff8001') == (255, 128, 1)
+        assert hex_to_rgb('#aBcDeF') == (171, 205, 239)
+        assert hex_to_rgb('  1a2b3c  ') == (26, 43, 60)
+
+    def test_matches_int_parse(self):
+        """测试与 int(..., 16) 解析结果一致"""
+        for value in range(0, 1 << 24, 4099):
+            hex_value = f"#{value:06x}"
+            expected = (value >> 16, (value >> 8) & 0xFF, value & 0xFF)
+            assert hex_to_rgb(hex_value) == expected, hex_value
+
+    @pytest.mark.parametrize('hex_value', [
+        '', '#FFF', '#FFFFFFF', '#GG0000', '#FF00 0', '#FF00:0',
+        '#FF00@0', '#FF00`0', '#FF00g0', '#FF00/0', '#FF00é0', '#\x10\x10\x10\x10\x10\x10',
+    ])
+    def test_invalid_values(self, hex_value):
+        """测试非法输入抛出 ValueError"""
+        with pytest.raises(ValueError):
+            hex_to_rgb(hex_value)
+
+
+class TestRgbToHex:
+    """测试 rgb_to_hex"""
+
+    def test_basic_values(self):
+        """测试常见颜色"""
+        assert rgb_to_hex(255, 0, 0) == '#FF0000'
+        assert rgb_to_hex(0, 0, 0) == '#000000'
+        assert rgb_to_hex(10, 171, 255) == '#0AABFF'
+
+    def test_roundtrip(self):
+        """测试与 hex_to_rgb 往返一致"""
+        for value in range(256):
+            rgb = (value, 255 - value, (value * 7) % 256)
+            assert hex_to_rgb(rgb_to_hex(*rgb)) == rgb
+
+    @pytest.mark.parametrize('rgb', [(-1, 0, 0), (0, 256, 0), (0, 0, 1000)])
+    def test_out_of_range(self, rgb):
+        """测试超出 0-255 的通道值抛出 ValueError"""
+        with pytest.raises(ValueError):
+            rgb_to_hex(*rgb)
+
+
+class TestSchemeGeneratorsLargeCount:
+    """测试大数量配色方案（向量化路径）"""
+
+    @pytest.mark.parametrize('count', [15, 16, 40])
+    def test_monochromatic_ranges(self, count):
+        """测试同色系饱和度与明度范围"""
+        colors = generate_monochromatic(200, count, 80)
+        assert len(colors) == count
+        assert all(h == 200 for h, _, _ in colors)
+        assert all(MIN_SATURATION <= s <= 80 and 40 <= b <= 100 for _, s, b in colors)
+        assert colors[0][1] == 80 and colors[-1][1] == MIN_SATURATION
+
+    @pytest.mark.parametrize('count', [15, 16, 40])
+    def test_analogous_hues(self, count):
+        """测试邻近色相均匀分布在角度范围内"""
+        colors = generate_analogous(10, 30, count)
+        assert len(colors) == count
+        assert colors[0][0] == pytest.approx(340)
+        assert colors[-1][0] == pytest.approx(40)
+        assert all(60 <= s <= 100 and b == 90 for _, s, b in colors)
+
+    @pytest.mark.parametrize('count', [15, 16, 40])
+    def test_other_schemes_count(self, count):
+        """测试互补、分离补色、双补色返回数量"""
+        for generator in (generate_complementary, generate_split_complementary, generate_double_complementary):
+            colors = generator(120, count=count)
+            assert len(colors) == count
+            assert all(0 <= h < 360 for h, _, _ in colors)
+
+
+_SCHEME_GENERATORS = [
+    generate_monochromatic,
+    generate_analogous,
+    generate_complementary,
+    generate_split_complementary,
+    generate_double_complementary,
+    generate_ryb_monochromatic,
+    generate_ryb_analogous,
+    generate_ryb_complementary,
+    generate_ryb_split_complementary,
+    generate_ryb_double_complementary,
+]
+
+
+class TestVectorizedSchemePaths:
+    """测试配色构建的向量化路径与逐个计算的循环路径结果逐位一致"""
+
+    # count == 4 在低于阈值时走专门的标量分支，向量化路径不会处理该数量
+    @pytest.mark.parametrize('count', [5, 6, 15, 16, 17, 40])
+    @pytest.mark.parametrize('generator', _SCHEME_GENERATORS, ids=lambda g: g.__name__)
+    def test_numpy_path_matches_loop(self, monkeypatch, generator, count):
+        """测试阈值两侧的数量下，强制向量化与强制循环的结果完全相同"""
+        for hue in (0, 37.3, 359.9):
+            for saturation in (0, 55.5, 100):
+                monkeypatch.setattr(color_module, '_VECTORIZE_MIN_COUNT', 0)
+                vectorized = generator(hue, count=count, base_saturation=saturation)
+                monkeypatch.setattr(color_module, '_VECTORIZE_MIN_COUNT', 10 ** 9)
+                looped = generator(hue, count=count, base_saturation=saturation)
+                assert vectorized == looped, (hue, saturation)
+
+
+class TestHsbToRgbBatch:
+    """测试向量化 HSB 转 RGB"""
+
+    def test_matches_single_conversion(self):
+        """测试与逐个调用 hsb_to_rgb 结果一致"""
+        hsb_colors = [
+            (h, s, b)
+            for h in (0, 30, 59.9, 60, 179.5, 240, 359.9, 360, 400, -30)
+            for s in (0, 33.3, 100)
+            for b in (0, 50, 87.5, 100)
+        ]
+        h, s, b = np.asarray(hsb_colors, dtype=np.float64).T
+        batch = [tuple(rgb) for rgb in _hsb_to_rgb_batch(h, s, b).tolist()]
+        assert batch == [hsb_to_rgb(*hsb) for hsb in hsb_colors]
+
+    def test_preview_colors_large_count(self):
+        """测试大数量预览颜色与逐个转换一致"""
+        hsb_colors = generate_analogous(75, 30, 24, 90)
+        expected = [hsb_to_rgb(*hsb) for hsb in hsb_colors]
+        assert get_scheme_preview_colors('analogous', 75, 24, 90, use_cache=False) == expected
+
+    def test_ryb_preview_colors_large_count(self):
+        """测试 RYB 大数量预览颜色与逐个转换一致"""
+        hsb_colors = generate_ryb_analogous(rgb_hue_to_ryb_hue(75), 30, 24, 90)
+        expected = [hsb_to_rgb(*hsb) for hsb in hsb_colors]
+        assert get_scheme_preview_colors_ryb('analogous', 75, 24, 90, use_cache=False) == expected
+
+
+class TestRybHuesToRgbHues:
+    """测试批量 RYB 色相转换"""
+
+    def test_matches_single_conversion(self):
+        """测试与逐个调用 ryb_hue_to_rgb_hue 结果一致（含分段边界）"""
+        hues = [-30, 0, 59.5, 120, 150.25, 180, 195, 210, 225.5, 240, 300, 359.9, 360, 725]
+        expected = [ryb_hue_to_rgb_hue(h) for h in hues]
+        assert _ryb_hues_to_rgb_hues(hues).tolist() == expected
+
+
+class TestSchemePreviewCache:
+    """测试配色预览缓存"""
+
+    @pytest.mark.parametrize('preview', [get_scheme_preview_colors, get_scheme_preview_colors_ryb])
+    def test_cached_result_matches_and_is_isolated(self, preview):
+        """测试缓存命中结果与直接计算一致，且修改返回值不影响缓存"""
+        expected = preview('split_complementary', 123.4, 5, 80, use_cache=False)
+        first = preview('split_complementary', 123.4, 5, 80)
+        first.append((0, 0, 0))
+        assert preview('split_complementary', 123.4, 5, 80) == expected
+        assert first[:-1] == expected
+
+    def test_key_is_integer_quantized(self):
+        """测试缓存键按 0.1 度色相和整数饱和度量化为整数"""
+        cache = ColorSchemeCache()
+        key = cache._get_key('analogous', 120.04, 5, 80.4)
+        assert key == ('analogous', 1200, 5, 80)
+        assert all(isinstance(part, int) for part in key[1:])
+        cache.set('analogous', 120.04, 5, 80.4, ((1, 2, 3),))
+        assert cache.get('analogous', 119.96, 5, 79.6) == ((1, 2, 3),)
+        assert cache.get('analogous', 120.1, 5, 80) is None
+
+
+class TestGetColorInfoCache:
+    """测试 get_color_info 缓存"""
+
+    def test_cached_result_is_isolated(self):
+        """测试修改返回字典不会污染缓存"""
+        first = get_color_info(12, 34, 56)
+        first['hex'] = '#FFFFFF'
+        second = get_color_info(12, 34, 56)
+        assert second['hex'] == '#0C2238'
+        assert second is not first
+
+    def test_colorspace_in_key(self):
+        """测试不同色彩空间分别缓存"""
+        srgb = get_color_info(255, 0, 0, 'sRGB')
+        adobe = get_color_info(255, 0, 0, 'Adobe RGB')
+        assert srgb['lab'] != adobe['lab']
+        assert srgb['hsb'] == adobe['hsb']
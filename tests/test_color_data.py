@@ -0,0 +1,131 @@
+"""测试配色源数据加载
+
+验证 color_data/ 目录下的配色源能被正确发现和解析
+"""
+from __future__ import annotations
+
+import sys
+import os
+
+# 添加项目根目录到 Python 路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import json
+
+import pytest
+from core.color_data import (
+    ColorSourceRegistry,
+    get_all_color_sources,
+    get_all_palettes,
+    get_color_source,
+    get_random_palettes,
+)
+
+
+COLOR_DATA_DIR = os.path.join(project_root, 'color_data')
+
+
+def _load_json(filename: str) -> dict:
+    """使用标准库 json 读取配色源文件，作为对照"""
+    with open(os.path.join(COLOR_DATA_DIR, filename), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class TestColorSourceRegistry:
+    """测试配色源注册表"""
+
+    def test_discovers_all_sources(self):
+        """测试 color_data/ 下的每个配色源都被加载"""
+        expected_ids = {
+            _load_json(filename)['id']
+            for filename in os.listdir(COLOR_DATA_DIR)
+            if filename.endswith('.json')
+        }
+        assert {source.id for source in get_all_color_sources()} == expected_ids
+
+    def test_palettes_match_json(self):
+        """测试解析结果与标准库 json 一致"""
+        data = _load_json('open_color.json')
+        source = get_color_source('open_color')
+        assert source is not None
+        assert source.name == data['name']
+        assert source.get_all_palettes() == data['palettes']
+        assert source.total_groups == len(data['groups'])
+
+    def test_unknown_source(self):
+        """测试不存在的配色源返回 None"""
+        assert get_color_source('no_such_source') is None
+
+    def test_invalid_file_is_skipped(self, tmp_path, monkeypatch, caplog):
+        """测试损坏的 JSON 文件被跳过并记录错误，其余配色源正常加载"""
+        data_dir = tmp_path / 'color_data'
+        data_dir.mkdir()
+        (data_dir / 'broken.json').write_text('{"id": ', encoding='utf-8')
+        (data_dir / 'valid.json').write_text(
+            json.dumps({'id': 'valid', 'name': 'Valid', 'palettes': [{'colors': ['#FFFFFF']}]}),
+            encoding='utf-8'
+        )
+        monkeypatch.setattr('core.color_data.get_base_path', lambda: str(tmp_path))
+        monkeypatch.setattr(ColorSourceRegistry, '_sources', {})
+        monkeypatch.setattr(ColorSourceRegistry, '_loaded', False)
+        monkeypatch.setattr(ColorSourceRegistry, '_unified_palettes', None)
+
+        with caplog.at_level('ERROR', logger='color_card.color_data'):
+            sources = get_all_color_sources()
+
+        assert [source.id for source in sources] == ['valid']
+        assert 'broken.json' in caplog.text
+
+
+class TestColorSourceGroups:
+    """测试配色源分组访问"""
+
+    def test_group_palettes_follow_indices(self):
+        """测试分组配色按分组索引顺序返回"""
+        data = _load_json('nice_palettes.json')
+        source = get_color_source('nice_palettes')
+        indices = data['groups'][1]['indices']
+        assert source.get_palettes_for_group(1) == [data['palettes'][i] for i in indices]
+
+    def test_batches_cover_group(self):
+        """测试分批获取的结果拼接后与整组一致"""
+        source = get_color_source('nice_palettes')
+        group = source.get_palettes_for_group(2)
+        batches = []
+        for start in range(0, len(group) + 10, 10):
+            batches.extend(source.get_palettes_for_group_batch(2, start, 10))
+        assert batches == group
+
+    def test_invalid_group_returns_all(self):
+        """测试无效分组索引返回全部配色"""
+        source = get_color_source('nice_palettes')
+        assert source.get_palettes_for_group(-1) == source.get_all_palettes()
+        assert source.get_palettes_for_group_batch(99, 0, 5) == source.get_all_palettes()[:5]
+
+
+class TestPaletteHelpers:
+    """测试统一格式的配色列表"""
+
+    def test_all_palettes_have_colors(self):
+        """测试统一格式配色均包含颜色且数量一致"""
+        palettes = get_all_palettes()
+        assert palettes
+        for palette in palettes:
+            assert palette['colors']
+            assert palette['color_count'] == len(palette['colors'])
+
+    def test_all_palettes_returns_new_list(self):
+        """测试每次返回新列表，修改返回值不影响缓存"""
+        palettes = get_all_palettes()
+        expected_len = len(palettes)
+        palettes.clear()
+        assert len(get_all_palettes()) == expected_len
+
+    @pytest.mark.parametrize('count', [0, 5, 10])
+    def test_random_palettes_count(self, count):
+        """测试随机配色数量"""
+        palettes = get_random_palettes(count)
+        assert len(palettes) == count
+        assert len({palette['id'] for palette in palettes}) == count
@@ -0,0 +1,77 @@
+"""测试 core.colorblind 色盲模拟
+
+验证向量化批量模拟与逐像素模拟结果一致
+"""
+from __future__ import annotations
+
+import sys
+import os
+
+# 添加项目根目录到 Python 路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import numpy as np
+import pytest
+from core.colorblind import (
+    COLORBLIND_TYPES,
+    simulate_colorblind,
+    simulate_colorblind_array,
+)
+
+
+@pytest.fixture(scope='module')
+def random_pixels() -> np.ndarray:
+    """固定随机种子的像素样本"""
+    rng = np.random.default_rng(42)
+    return rng.integers(0, 256, size=(2000, 3), dtype=np.uint8)
+
+
+class TestSimulateColorblindArray:
+    """测试向量化色盲模拟"""
+
+    @pytest.mark.parametrize('cvd_type', list(COLORBLIND_TYPES))
+    @pytest.mark.parametrize('severity', [0.0, 0.5, 1.0])
+    def test_matches_scalar(self, random_pixels, cvd_type, severity):
+        """测试批量结果与逐像素结果一致"""
+        result = simulate_colorblind_array(random_pixels, cvd_type, severity)
+        expected = np.array([
+            simulate_colorblind(tuple(int(c) for c in pixel), cvd_type, severity)
+            for pixel in random_pixels
+        ])
+        assert result.dtype == np.uint8
+        assert np.array_equal(result, expected)
+
+    def test_float_input_matches_uint8(self, random_pixels):
+        """测试取值为整数的浮点输入与 uint8 输入结果一致"""
+        uint8_result = simulate_colorblind_array(random_pixels, 'tritanomaly', 0.7)
+        float_result = simulate_colorblind_array(random_pixels.astype(np.float64), 'tritanomaly', 0.7)
+        assert np.array_equal(uint8_result, float_result)
+
+    @pytest.mark.parametrize('cvd_type, severity', [
+        ('normal', 0.5), ('protanomaly', 0.0), ('unknown', 0.5), ('achromatopsia', 0.5), ('deuteranopia', 0.5),
+    ])
+    def test_out_of_range_input_is_clipped(self, cvd_type, severity):
+        """测试越界的浮点输入在所有路径上都被裁剪，而不是回绕"""
+        result = simulate_colorblind_array(np.array([[255.7, -1.0, 300.0]]), cvd_type, severity)
+        expected = simulate_colorblind((255, 0, 255), cvd_type, severity)
+        assert tuple(result[0].tolist()) == expected
+
+    def test_preserves_image_shape(self):
+        """测试 (H, W, 3) 图像输入的形状保持不变"""
+        image = np.full((4, 5, 3), 128, dtype=np.uint8)
+        result = simulate_colorblind_array(image, 'deuteranopia')
+        assert result.shape == image.shape
+
+    def test_extreme_colors(self):
+        """测试纯色与黑白的结果在有效范围内且与逐像素一致"""
+        colors = [(0, 0, 0), (255, 255, 255), (255, 0, 0), (0, 255, 0), (0, 0, 255)]
+        result = simulate_colorblind_array(np.array(colors), 'protanopia')
+        for rgb, simulated in zip(colors, result.tolist()):
+            assert tuple(simulated) == simulate_colorblind(rgb, 'protanopia')
+
+    def test_invalid_shape(self):
+        """测试最后一维不是 3 时抛出异常"""
+        with pytest.raises(ValueError):
+            simulate_colorblind_array(np.zeros((2, 4)), 'protanopia')
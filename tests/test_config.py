@@ -0,0 +1,98 @@
+"""测试 core.config 配置管理器
+
+验证配置文件的加载缓存与保存
+"""
+from __future__ import annotations
+
+import sys
+import os
+
+# 添加项目根目录到 Python 路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import json
+
+import pytest
+from core.config import ConfigManager
+
+
+@pytest.fixture
+def config_manager(tmp_path, monkeypatch) -> ConfigManager:
+    """配置文件位于临时目录的配置管理器"""
+    monkeypatch.setattr(
+        ConfigManager, '_get_config_path',
+        lambda self: tmp_path / 'config_dir' / ConfigManager.CONFIG_FILE_NAME
+    )
+    return ConfigManager()
+
+
+def _write_config(manager: ConfigManager, config: dict, mtime_ns: int) -> None:
+    """写入配置文件并设置修改时间"""
+    manager._config_path.parent.mkdir(parents=True, exist_ok=True)
+    manager._config_path.write_text(json.dumps(config), encoding='utf-8')
+    os.utime(manager._config_path, ns=(mtime_ns, mtime_ns))
+
+
+class TestConfigLoad:
+    """测试配置加载"""
+
+    def test_missing_file_uses_defaults(self, config_manager):
+        """测试配置文件不存在时使用默认配置"""
+        config = config_manager.load()
+        assert config['settings']['theme'] == 'auto'
+
+    def test_unchanged_file_is_not_reparsed(self, config_manager, monkeypatch):
+        """测试配置文件未修改时不再重复解析"""
+        _write_config(config_manager, {'settings': {'theme': 'dark'}}, 1_000_000_000)
+        assert config_manager.load()['settings']['theme'] == 'dark'
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError('配置文件未修改，不应重新解析')
+
+        monkeypatch.setattr(json, 'load', fail_load)
+        assert config_manager.load()['settings']['theme'] == 'dark'
+
+    def test_modified_file_is_reloaded(self, config_manager):
+        """测试配置文件被外部修改后重新加载"""
+        _write_config(config_manager, {'settings': {'theme': 'dark'}}, 1_000_000_000)
+        config_manager.load()
+        _write_config(config_manager, {'settings': {'theme': 'light'}}, 2_000_000_000)
+        assert config_manager.load()['settings']['theme'] == 'light'
+
+    def test_force_reload(self, config_manager):
+        """测试 reload=True 时强制重新读取"""
+        _write_config(config_manager, {'settings': {'theme': 'dark'}}, 1_000_000_000)
+        config_manager.load()
+        config_manager.set('settings.theme', 'light')
+        assert config_manager.load()['settings']['theme'] == 'light'
+        assert config_manager.load(reload=True)['settings']['theme'] == 'dark'
+
+
+class TestConfigSave:
+    """测试配置保存"""
+
+    def test_save_creates_directory_once(self, config_manager, monkeypatch):
+        """测试首次保存创建配置目录，之后不再调用 mkdir"""
+        config_manager.set('settings.theme', 'dark')
+        config_manager.save()
+        saved = json.loads(config_manager._config_path.read_text(encoding='utf-8'))
+        assert saved['settings']['theme'] == 'dark'
+
+        def fail_mkdir(*args, **kwargs):
+            raise AssertionError('配置目录已存在，不应再次创建')
+
+        monkeypatch.setattr(type(config_manager._config_path.parent), 'mkdir', fail_mkdir)
+        config_manager.save()
+
+    def test_save_recreates_removed_directory(self, config_manager):
+        """测试配置目录被外部删除后，下一次保存重新创建目录并写入成功"""
+        config_manager.save()
+        config_manager._config_path.unlink()
+        config_manager._config_path.parent.rmdir()
+
+        config_manager.set('settings.theme', 'light')
+        config_manager.save()
+        saved = json.loads(config_manager._config_path.read_text(encoding='utf-8'))
+        assert saved['settings']['theme'] == 'light'
@@ -0,0 +1,180 @@
+"""测试主色调提取（MMCQ / K-Means）及主色位置查找
+
+验证量化结果数量、颜色正确性以及各输入路径的一致性
+"""
+from __future__ import annotations
+
+import sys
+import os
+
+# 添加项目根目录到 Python 路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import gc
+
+import numpy as np
+import pytest
+from PIL import Image
+from PySide6.QtGui import QImage
+from core.color import (
+    _mmcq_quantize,
+    _DOMINANT_SAMPLE_BUDGET,
+    _qimage_to_numpy,
+    _sample_pixels_with_edges,
+    extract_dominant_colors,
+    find_dominant_color_positions,
+)
+
+
+def _make_blocks_image(colors: list[tuple[int, int, int]], block: int = 16) -> np.ndarray:
+    """生成由纵向色块组成的 (H, W, 3) 像素数组"""
+    arr = np.zeros((block, block * len(colors), 3), dtype=np.uint8)
+    for i, color in enumerate(colors):
+        arr[:, i * block:(i + 1) * block] = color
+    return arr
+
+
+class TestMmcqQuantize:
+    """测试 MMCQ 量化"""
+
+    def test_empty_input(self):
+        """测试空输入"""
+        assert _mmcq_quantize(np.zeros((0, 3), dtype=np.int32), 5) == []
+
+    def test_reaches_target_count(self):
+        """测试立方体数量达到目标"""
+        rng = np.random.default_rng(0)
+        pixels = rng.integers(0, 256, (2000, 3)).astype(np.int32)
+        cubes = _mmcq_quantize(pixels, 8)
+        assert len(cubes) == 8
+        assert sum(cube.get_count() for cube in cubes) == len(pixels)
+
+    def test_stops_when_unsplittable(self):
+        """测试像素不足时提前停止"""
+        pixels = np.array([[10, 20, 30], [40, 50, 60]], dtype=np.int32)
+        cubes = _mmcq_quantize(pixels, 8)
+        assert len(cubes) == 2
+        assert sorted(cube.get_average_color() for cube in cubes) == [(10, 20, 30), (40, 50, 60)]
+
+
+class TestExtractDominantColors:
+    """测试主色调提取"""
+
+    def test_solid_image(self):
+        """测试纯色图片所有主色调均为该颜色"""
+        arr = _make_blocks_image([(12, 34, 56)])
+        result = extract_dominant_colors(None, 5, sample_step=2, original_pixels=arr)
+        assert result == [(12, 34, 56)] * 5
+
+    def test_dominant_block_first(self):
+        """测试面积最大的颜色排在首位"""
+        arr = _make_blocks_image([(255, 0, 0), (255, 0, 0), (255, 0, 0), (0, 0, 255)])
+        result = extract_dominant_colors(None, 3, sample_step=1, original_pixels=arr)
+        assert len(result) == 3
+        assert result[0] == (255, 0, 0)
+
+
+class TestSamplePixelsWithEdges:
+    """测试像素采样"""
+
+    def test_small_image_keeps_step(self):
+        """测试小图按指定步长采样并附加边缘像素"""
+        arr = np.zeros((10, 7, 3), dtype=np.uint8)
+        pixels = _sample_pixels_with_edges(arr, 2)
+        assert len(pixels) == 5 * 4 + 5 + 4
+
+    def test_large_image_bounded_by_budget(self):
+        """测试大图自动增大步长，采样数不超过上限"""
+        arr = np.zeros((1500, 2000, 3), dtype=np.uint8)
+        pixels = _sample_pixels_with_edges(arr, 1)
+        assert len(pixels) <= _DOMINANT_SAMPLE_BUDGET + 1500 + 2000
+
+
+class TestImageInputs:
+    """测试 QImage、PIL Image 与像素数组输入路径一致"""
+
+    def test_pil_matches_qimage(self):
+        """测试 PIL Image 与 QImage 得到相同的主色调和位置"""
+        arr = _make_blocks_image([(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+        height, width = arr.shape[:2]
+        qimage = QImage(arr.tobytes(), width, height, width * 3, QImage.Format.Format_RGB888).copy()
+        pil_image = Image.fromarray(arr)
+
+        colors = extract_dominant_colors(qimage, 3)
+        assert extract_dominant_colors(pil_image, 3) == colors
+        assert (find_dominant_color_positions(pil_image, colors)
+                == find_dominant_color_positions(qimage, colors))
+
+    def test_ndarray_matches_qimage(self):
+        """测试直接传入像素数组（含 alpha 通道）与 QImage 结果一致"""
+        arr = _make_blocks_image([(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+        height, width = arr.shape[:2]
+        qimage = QImage(arr.tobytes(), width, height, width * 3, QImage.Format.Format_RGB888).copy()
+        rgba = np.dstack([arr, np.full((height, width), 255, dtype=np.uint8)])
+
+        colors = extract_dominant_colors(qimage, 3)
+        assert extract_dominant_colors(rgba, 3) == colors
+        assert find_dominant_color_positions(rgba, colors) == find_dominant_color_positions(qimage, colors)
+
+
+class TestFindDominantColorPositions:
+    """测试主色调位置查找"""
+
+    def test_block_centers(self):
+        """测试每种颜色定位到对应色块中心"""
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255)]
+        arr = _make_blocks_image(colors, block=16)
+        positions = find_dominant_color_positions(None, colors, sample_step=1, original_pixels=arr)
+        assert len(positions) == len(colors)
+        for i, (rel_x, rel_y) in enumerate(positions):
+            assert rel_x == pytest.approx((i * 16 + 7.5) / arr.shape[1])
+            assert rel_y == pytest.approx(7.5 / arr.shape[0])
+
+    def test_unmatched_color_defaults_to_center(self):
+        """测试没有像素归属的主色返回中心点"""
+        arr = _make_blocks_image([(0, 0, 0)])
+        positions = find_dominant_color_positions(
+            None, [(0, 0, 0), (255, 255, 255)], sample_step=2, original_pixels=arr
+        )
+        assert positions[1] == (0.5, 0.5)
+
+    def test_empty_colors(self):
+        """测试空主色列表"""
+        assert find_dominant_color_positions(None, [], original_pixels=_make_blocks_image([(1, 2, 3)])) == []
+
+
+class TestQImageToNumpy:
+    """测试 QImage 转 NumPy 数组"""
+
+    @pytest.mark.parametrize('image_format', [
+        QImage.Format.Format_RGB888,
+        QImage.Format.Format_RGB32,
+        QImage.Format.Format_ARGB32,
+        QImage.Format.Format_RGBA8888,
+    ])
+    def test_formats_with_row_padding(self, image_format):
+        """测试各格式及行对齐（奇数宽度）下像素值正确"""
+        rng = np.random.default_rng(0)
+        arr = rng.integers(0, 256, (7, 5, 3)).astype(np.uint8)
+        source = QImage(arr.tobytes(), 5, 7, 15, QImage.Format.Format_RGB888).copy()
+        image = source.convertToFormat(image_format)
+        assert np.array_equal(_qimage_to_numpy(image), arr)
+
+    @pytest.mark.parametrize('image_format', [
+        QImage.Format.Format_RGB888,
+        QImage.Format.Format_RGB32,
+        QImage.Format.Format_RGBA8888,
+    ])
+    def test_view_keeps_temporary_image_alive(self, image_format):
+        """测试传入临时图像时，返回的视图在图像无其他引用后仍然有效"""
+        rng = np.random.default_rng(1)
+        arr = rng.integers(0, 256, (64, 33, 3)).astype(np.uint8)
+        source = QImage(arr.tobytes(), 33, 64, 99, QImage.Format.Format_RGB888).copy()
+        sampled = _qimage_to_numpy(source.convertToFormat(image_format))[::2, ::2]
+        gc.collect()
+        # 分配并填充内存，若图像已被释放，其内存很可能被复用覆盖
+        filler = [np.full(64 * 33 * 4, 255, dtype=np.uint8) for _ in range(32)]
+        assert np.array_equal(sampled, arr[::2, ::2])
+        assert len(filler) == 32